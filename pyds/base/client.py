@@ -5,10 +5,17 @@ Base client class with common functionality for all DeepChem API clients.
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..settings import Settings
 
 
+POOL_CONNECTIONS = 16  # Per-host connection pools kept by a client-owned session
+POOL_MAXSIZE = 32  # Kept-alive connections reused per pool
+RETRY_BACKOFF_FACTOR = 0.2  # Backoff between retries when max_retries is set
+
+
 class BaseClient:
     """
     Base client class containing common functionality for all DeepChem API clients.
@@ -17,20 +24,41 @@ class BaseClient:
     and other common operations that are used by specific client implementations.
     """
 
-    def __init__(self, settings: Optional[Settings] = None, base_url: Optional[str] = None):
+    def __init__(self,
+                 settings: Optional[Settings] = None,
+                 base_url: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 max_retries: int = 0):
         """
         Initialize BaseClient.
 
         Args:
             settings: Settings instance for configuration
             base_url: Base URL for the API (overrides settings if provided)
+            session: HTTP session to send requests with (a pooled session owned
+                by the client is created if not provided)
+            max_retries: Retries of failed connections for a client-owned
+                session, with exponential backoff (default: 0, fail immediately)
         """
         if settings is None:
             settings = Settings()
 
         self.settings = settings
         self.base_url = base_url or settings.get_base_url()
-        self.session = requests.Session()
+
+        # A caller-provided session may be shared with other clients, so it is
+        # used as-is and left open by close()
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=Retry(total=max_retries, backoff_factor=RETRY_BACKOFF_FACTOR) if max_retries else 0,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
 
     def _check_configuration(self) -> None:
         """
@@ -240,6 +268,7 @@ class BaseClient:
 
     def close(self) -> None:
         """
-        Close the HTTP session.
+        Close the HTTP session if it was created by this client.
         """
-        self.session.close()
+        if self._owns_session:
+            self.session.close()
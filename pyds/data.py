@@ -7,6 +7,7 @@ Contains the Data class for all data management operations.
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
+import requests
 from requests_toolbelt import MultipartEncoder
 
 from .base import BaseClient
@@ -20,15 +21,23 @@ class Data(BaseClient):
     This class provides methods for data management operations.
     """
 
-    def __init__(self, settings: Optional[Settings] = None, base_url: Optional[str] = None):
+    def __init__(self,
+                 settings: Optional[Settings] = None,
+                 base_url: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 max_retries: int = 0):
         """
         Initialize Data client.
 
         Args:
             settings: Settings instance for configuration
             base_url: Base URL for the API (overrides settings if provided)
+            session: HTTP session to send requests with (a pooled session owned
+                by the client is created if not provided)
+            max_retries: Retries of failed connections for a client-owned
+                session (default: 0, fail immediately)
         """
-        super().__init__(settings, base_url)
+        super().__init__(settings, base_url, session, max_retries)
 
     def upload_data(
         self,
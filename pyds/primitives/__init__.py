@@ -6,9 +6,9 @@ Each primitive implements the 'run' method to execute its specific functionality
 """
 
 from .base import Primitive
+from .docking import Docking
 from .evaluate import Evaluate
 from .featurize import Featurize
-from .docking import Docking
 from .infer import Infer
 from .splitter import TVTSplit
 from .train import Train
@@ -7,6 +7,8 @@ Contains the abstract Primitive class that all specific primitive implementation
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
+import requests
+
 from ..base import BaseClient
 from ..settings import Settings
 
@@ -19,15 +21,23 @@ class Primitive(BaseClient, ABC):
     the interface that each primitive must implement, including the abstract 'run' method.
     """
 
-    def __init__(self, settings: Optional[Settings] = None, base_url: Optional[str] = None):
+    def __init__(self,
+                 settings: Optional[Settings] = None,
+                 base_url: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 max_retries: int = 0):
         """
         Initialize Primitive.
 
         Args:
             settings: Settings instance for configuration
             base_url: Base URL for the API (overrides settings if provided)
+            session: HTTP session to send requests with (a pooled session owned
+                by the client is created if not provided)
+            max_retries: Retries of failed connections for a client-owned
+                session (default: 0, fail immediately)
         """
-        super().__init__(settings, base_url)
+        super().__init__(settings, base_url, session, max_retries)
 
     @abstractmethod
     def run(self, *args, **kwargs) -> Dict[str, Any]:
@@ -2,10 +2,311 @@
 Settings module for managing profile and project configurations.
 """
 
+import copy
+import glob
 import json
+import logging
+import math
 import os
 from pathlib import Path
-from typing import Any, Optional
+import tempfile
+import time
+from typing import Any, Optional, Protocol, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Age in seconds after which a temporary settings file is assumed to be left
+# behind by an interrupted write, even if its writer's pid is in use
+STALE_TMP_FILE_AGE = 600
+
+# Use orjson for settings (de)serialization when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    ORJSON_AVAILABLE = False
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """
+    Check whether data contains a NaN or infinite float.
+
+    Args:
+        data: Data to check
+
+    Returns:
+        True if a float in data, its lists or dict values is NaN or infinite
+    """
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in data)
+    return False
+
+
+def _dumps_json(data: Any) -> str:
+    """
+    Serialize data to an indented JSON string, using orjson when available.
+
+    Data orjson does not support (e.g. integers wider than 64 bits) or would
+    write differently (NaN and infinite floats, which orjson writes as null)
+    is serialized with the json module instead, so what is saved does not
+    depend on whether orjson is installed.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE and not _has_non_finite_float(data):
+        try:
+            # Like json, write non-string dict keys (e.g. ints) as strings
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2)
+
+
+def _loads_json(content: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when available.
+
+    Documents orjson rejects (e.g. with the NaN and Infinity values json
+    writes) are parsed with the json module instead.
+
+    Args:
+        content: JSON document
+
+    Returns:
+        Parsed data
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+class SettingsStore(Protocol):
+    """
+    Storage backend used by Settings to persist its data.
+    """
+
+    def exists(self) -> bool:
+        """Check whether any settings have been stored."""
+        ...
+
+    def read(self) -> dict[str, Any]:
+        """Read the stored settings data."""
+        ...
+
+    def write(self, settings_data: dict[str, Any]) -> None:
+        """Replace the stored settings data."""
+        ...
+
+    def remove(self) -> None:
+        """Remove the stored settings data."""
+        ...
+
+
+class JSONFileStore:
+    """
+    Settings store backed by a JSON file on disk.
+
+    Writes are atomic, and parsed file contents are cached so that unchanged
+    files are not re-parsed by later reads. Reads return a copy of the cached
+    data, which callers may modify.
+    """
+
+    # Parsed settings files keyed by path, tagged with the (mtime_ns, size)
+    # stamp of the file they were parsed from.
+    _parse_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+    def __init__(self, settings_file: Union[str, Path]):
+        """
+        Initialize JSONFileStore instance.
+
+        Args:
+            settings_file: Path to the settings JSON file
+        """
+        self.settings_file = Path(settings_file)
+        self._stale_tmp_removed = False
+
+    def exists(self) -> bool:
+        """
+        Check whether the settings file exists.
+
+        Returns:
+            True if the settings file exists, False otherwise
+        """
+        return self.settings_file.exists()
+
+    def read(self) -> dict[str, Any]:
+        """
+        Read the settings file, reusing the parsed data if the file is unchanged.
+
+        Temporary files left behind by interrupted writes are removed on the
+        first read.
+
+        Returns:
+            Parsed settings data, not shared with the cache or other readers
+        """
+        if not self._stale_tmp_removed:
+            self._remove_stale_tmp_files()
+
+        path = str(self.settings_file)
+        stamp = self._file_stamp()
+        cached = JSONFileStore._parse_cache.get(path)
+        if cached is None or cached[0] != stamp:
+            with open(self.settings_file, "rb") as f:
+                cached = (stamp, _loads_json(f.read()))
+            JSONFileStore._parse_cache[path] = cached
+        return copy.deepcopy(cached[1])
+
+    def write(self, settings_data: dict[str, Any]) -> None:
+        """
+        Atomically write settings data to the settings file.
+
+        The data is written and fsynced to a temporary file next to the settings
+        file, which then replaces it, so readers never observe a partial file.
+
+        Args:
+            settings_data: Data to write
+        """
+        serialized = _dumps_json(settings_data)
+        # A name unique to this write, so that concurrent writes from other
+        # threads or processes do not share a temporary file
+        fd, tmp_file = tempfile.mkstemp(dir=self.settings_file.parent,
+                                        prefix=f"{self.settings_file.name}.{os.getpid()}.",
+                                        suffix=".tmp")
+        os.close(fd)
+        try:
+            with open(tmp_file, "w") as f:
+                f.write(serialized)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.settings_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
+
+        # Cache what a read of the file would return (e.g. tuples become lists),
+        # not the caller's objects
+        JSONFileStore._parse_cache[str(self.settings_file)] = (self._file_stamp(), _loads_json(serialized))
+
+    def remove(self) -> None:
+        """
+        Remove the settings file if it exists.
+        """
+        JSONFileStore._parse_cache.pop(str(self.settings_file), None)
+        if self.settings_file.exists():
+            os.remove(self.settings_file)
+
+    def _file_stamp(self) -> tuple[int, int]:
+        """
+        Get a stamp identifying the current contents of the settings file.
+
+        Returns:
+            Tuple of (modification time in nanoseconds, size in bytes)
+        """
+        st = os.stat(self.settings_file)
+        return st.st_mtime_ns, st.st_size
+
+    def _remove_stale_tmp_files(self) -> None:
+        """
+        Remove temporary files left behind by interrupted writes.
+
+        Files that another process may still be writing are kept.
+        """
+        self._stale_tmp_removed = True
+        for tmp_file in glob.glob(glob.escape(str(self.settings_file)) + ".*.tmp"):
+            try:
+                if self._is_stale_tmp_file(tmp_file):
+                    os.unlink(tmp_file)
+            except OSError:
+                pass
+
+    def _is_stale_tmp_file(self, tmp_file: str) -> bool:
+        """
+        Check whether a temporary file was left behind by an interrupted write.
+
+        Args:
+            tmp_file: Path of a temporary file named <settings file>.<pid>.<random>.tmp
+
+        Returns:
+            True if the file is older than STALE_TMP_FILE_AGE or, on POSIX,
+            the process that wrote it is no longer running
+        """
+        if time.time() - os.path.getmtime(tmp_file) > STALE_TMP_FILE_AGE:
+            return True
+
+        pid_part = tmp_file[len(str(self.settings_file)) + 1:].split(".", 1)[0]
+        if os.name != "posix" or not pid_part.isdigit() or int(pid_part) == os.getpid():
+            return False
+        try:
+            # Signal 0 only checks whether the process exists
+            os.kill(int(pid_part), 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # e.g. PermissionError: the process exists but belongs to another user
+            pass
+        return False
+
+
+class InMemoryStore:
+    """
+    Settings store that keeps settings data in memory.
+
+    Useful when settings should not be persisted, e.g. in tests.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty InMemoryStore instance.
+        """
+        self.data: Optional[dict[str, Any]] = None
+
+    def exists(self) -> bool:
+        """
+        Check whether any settings have been stored.
+
+        Returns:
+            True if settings data has been written, False otherwise
+        """
+        return self.data is not None
+
+    def read(self) -> dict[str, Any]:
+        """
+        Read a copy of the stored settings data.
+
+        Returns:
+            Stored settings data
+        """
+        return copy.deepcopy(self.data or {})
+
+    def write(self, settings_data: dict[str, Any]) -> None:
+        """
+        Store a copy of the settings data.
+
+        Args:
+            settings_data: Data to store
+        """
+        self.data = copy.deepcopy(settings_data)
+
+    def remove(self) -> None:
+        """
+        Remove the stored settings data.
+        """
+        self.data = None
 
 
 class Settings:
@@ -13,7 +314,8 @@ class Settings:
     Settings class for managing profile and project configurations.
 
     This class handles storing and loading user settings including profile
-    and project information, and persists them to a .pyds.settings.json file.
+    and project information, and persists them to a .pyds.settings.json file
+    (or to a custom SettingsStore).
     """
 
     def __init__(
@@ -23,6 +325,7 @@ class Settings:
         project: Optional[str] = None,
         base_url: Optional[str] = None,
         additional_settings: Optional[dict] = None,
+        store: Optional[SettingsStore] = None,
     ):
         """
         Initialize Settings instance.
@@ -33,8 +336,11 @@ class Settings:
             project: Initial project name (optional)
             base_url: Base URL for the DeepChem server (optional)
             additional_settings: Additional settings to initialize (optional)
+            store: Storage backend for the settings (default: JSON file at settings_file)
         """
         self.settings_file = Path(settings_file)
+        self._store = store
+        self._file_store: Optional[JSONFileStore] = None
 
         # Initialize defaults
         self.profile = None
@@ -42,7 +348,7 @@ class Settings:
         self.base_url = "http://localhost:8000"
         self._additional_settings = {}
 
-        if not os.path.exists(settings_file):
+        if not self._get_store().exists():
             self.touch()
 
         # Load existing settings first
@@ -155,10 +461,9 @@ class Settings:
                 "base_url": None,
                 "additional_settings": {},
             }
-            with open(self.settings_file, "w") as f:
-                json.dump(empty_settings, f, indent=2)
+            self._get_store().write(empty_settings)
         except Exception as e:
-            print(f"Warning: Could not update settings file timestamp: {e}")
+            logger.warning(f"Could not update settings file timestamp: {e}")
 
     def save(self) -> None:
         """
@@ -172,29 +477,44 @@ class Settings:
         }
 
         try:
-            with open(self.settings_file, "w") as f:
-                json.dump(settings_data, f, indent=2)
+            self._get_store().write(settings_data)
         except Exception as e:
-            print(f"Warning: Could not save settings to {self.settings_file}: {e}")
+            logger.warning(f"Could not save settings to {self.settings_file}: {e}")
 
     def load(self) -> None:
         """
         Load settings from the JSON file if it exists.
         """
-        if not self.settings_file.exists():
+        store = self._get_store()
+        if not store.exists():
             return
 
         try:
-            with open(self.settings_file, "r") as f:
-                settings_data = json.load(f)
+            settings_data = store.read()
 
             self.profile = settings_data.get("profile")
             self.project = settings_data.get("project")
             self.base_url = settings_data.get("base_url") or "http://localhost:8000"
-            self._additional_settings = settings_data.get("additional_settings", {})
+            self._additional_settings = settings_data.get("additional_settings") or {}
 
         except Exception as e:
-            print(f"Warning: Could not load settings from {self.settings_file}: {e}")
+            logger.warning(f"Could not load settings from {self.settings_file}: {e}")
+
+    def _get_store(self) -> SettingsStore:
+        """
+        Get the storage backend for these settings.
+
+        Unless a custom store was provided, settings are stored in a JSON file
+        at the current settings_file path.
+
+        Returns:
+            Settings store
+        """
+        if self._store is not None:
+            return self._store
+        if self._file_store is None or self._file_store.settings_file != self.settings_file:
+            self._file_store = JSONFileStore(self.settings_file)
+        return self._file_store
 
     def reset(self) -> None:
         """
@@ -205,11 +525,10 @@ class Settings:
         self.base_url = "http://localhost:8000"
         self._additional_settings = {}
 
-        if self.settings_file.exists():
-            try:
-                os.remove(self.settings_file)
-            except Exception as e:
-                print(f"Warning: Could not remove settings file {self.settings_file}: {e}")
+        try:
+            self._get_store().remove()
+        except Exception as e:
+            logger.warning(f"Could not remove settings file {self.settings_file}: {e}")
 
     def is_configured(self) -> bool:
         """
@@ -2,27 +2,41 @@
 Pytest configuration and fixtures for pyds tests.
 """
 
+import itertools
+import json
 import os
-from typing import Any, Dict, Generator, List
+from pathlib import Path
+import shutil
+from typing import Any, Callable, Dict, Generator, List, Optional
+import uuid
 
+from filelock import FileLock
 import pytest
+import requests
 import responses
 
 from pyds import Settings
 from pyds.base.client import BaseClient
 from pyds.data import Data
 from pyds.primitives import Evaluate, Featurize, Infer, Train
+from pyds.settings import InMemoryStore
 
 from .test_utils import (
+    bulk_upload,
     cleanup_temp_file,
+    content_hash,
     create_classification_csv,
     create_regression_csv,
     create_test_settings_file,
+    DEBUG_CACHING,
+    debug_caching,
     get_complex_regression_dataset,
     get_large_classification_dataset,
     get_minimal_classification_dataset,
     get_simple_regression_dataset,
     get_small_classification_dataset,
+    set_debug_cache,
+    upload_cache_key,
 )
 
 
@@ -49,6 +63,17 @@ def test_settings(temp_settings_file: str) -> Settings:
     return settings
 
 
+@pytest.fixture
+def in_memory_settings() -> Settings:
+    """Create test settings instance that is kept in memory instead of on disk."""
+    return Settings(
+        store=InMemoryStore(),
+        profile="test_profile",
+        project="test_project",
+        base_url="http://localhost:8000",
+    )
+
+
 @pytest.fixture
 def test_settings_not_configured(temp_settings_file: str) -> Settings:
     """Create test settings instance without profile/project configured."""
@@ -93,15 +118,13 @@ def data_client(test_settings: Settings) -> Data:
 
 
 @pytest.fixture
-def temp_test_file() -> Generator[str, None, None]:
+def temp_test_file(small_classification_csv: str, tmp_path: Path) -> str:
     """Create a temporary test file for upload testing."""
-    # Use the same data as small_classification_csv for consistency
-    test_file = create_classification_csv(size="small")
-
-    yield test_file
-
-    # Clean up
-    cleanup_temp_file(test_file)
+    # Tests may overwrite the file, so each one gets a copy of the session-wide
+    # small classification CSV; pytest removes tmp_path afterwards
+    test_file = tmp_path / os.path.basename(small_classification_csv)
+    shutil.copyfile(small_classification_csv, test_file)
+    return str(test_file)
 
 
 @pytest.fixture
@@ -179,59 +202,123 @@ def test_metrics() -> List[str]:
 
 
 # Live server testing fixtures
-@pytest.fixture
+# Live clients are session-scoped so every test reuses the same keep-alive
+# HTTP connections instead of opening new ones.
+@pytest.fixture(scope="session")
 def live_server_url() -> str:
     """URL for live server testing."""
     return os.getenv("PYDS_TEST_SERVER_URL", "http://localhost:8000")
 
 
-@pytest.fixture
-def live_settings(temp_settings_file: str, live_server_url: str) -> Settings:
+@pytest.fixture(scope="session")
+def live_settings_file() -> Generator[str, None, None]:
+    """Create a settings file shared by the live server clients."""
+    settings_file = create_test_settings_file()
+
+    yield settings_file
+
+    cleanup_temp_file(settings_file)
+
+
+@pytest.fixture(scope="session")
+def live_settings(live_settings_file: str, live_server_url: str) -> Settings:
     """Create settings for live server testing."""
     return Settings(
-        settings_file=temp_settings_file,
+        settings_file=live_settings_file,
         profile=os.getenv("PYDS_TEST_PROFILE", "test_profile"),
         project=os.getenv("PYDS_TEST_PROJECT", "test_project"),
         base_url=live_server_url,
     )
 
 
-@pytest.fixture
-def live_base_client(live_settings: Settings) -> BaseClient:
+@pytest.fixture(scope="session")
+def cached_http_session(pytestconfig: pytest.Config) -> Generator[Optional[requests.Session], None, None]:
+    """
+    HTTP session that caches live server responses across test runs.
+
+    Only used when the DEBUG_CACHING environment variable is set, since
+    replayed responses do not exercise the server and go stale when its
+    datastore is reset. Responses are kept in a SQLite file under the pytest
+    cache directory, and uploads are keyed on file content (see
+    `upload_cache_key`). Yields None (clients create their own sessions)
+    when caching is off, `requests_cache` is not installed or the pytest
+    cache is disabled.
+    """
+    if not DEBUG_CACHING:
+        yield None
+        return
+
+    try:
+        import requests_cache
+    except ImportError:
+        yield None
+        return
+
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is None:
+        yield None
+        return
+
+    session = requests_cache.CachedSession(
+        cache_name=str(cache.mkdir("http") / "reqs"),
+        backend="sqlite",
+        allowable_methods=("GET", "POST"),
+        expire_after=3600,
+        key_fn=upload_cache_key,
+    )
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def live_base_client(live_settings: Settings) -> Generator[BaseClient, None, None]:
     """Create BaseClient for live server testing."""
-    return BaseClient(settings=live_settings)
+    client = BaseClient(settings=live_settings)
+    yield client
+    client.close()
 
 
-@pytest.fixture
-def live_featurize_client(live_settings: Settings) -> Featurize:
+@pytest.fixture(scope="session")
+def live_featurize_client(live_settings: Settings,
+                          cached_http_session: Optional[requests.Session]) -> Generator[Featurize, None, None]:
     """Create Featurize client for live server testing."""
-    return Featurize(settings=live_settings)
+    client = Featurize(settings=live_settings, session=cached_http_session)
+    yield client
+    client.close()
 
 
-@pytest.fixture
-def live_train_client(live_settings: Settings) -> Train:
+@pytest.fixture(scope="session")
+def live_train_client(live_settings: Settings) -> Generator[Train, None, None]:
     """Create Train client for live server testing."""
-    return Train(settings=live_settings)
+    client = Train(settings=live_settings)
+    yield client
+    client.close()
 
 
-@pytest.fixture
-def live_evaluate_client(live_settings: Settings) -> Evaluate:
+@pytest.fixture(scope="session")
+def live_evaluate_client(live_settings: Settings) -> Generator[Evaluate, None, None]:
     """Create Evaluate client for live server testing."""
-    return Evaluate(settings=live_settings)
+    client = Evaluate(settings=live_settings)
+    yield client
+    client.close()
 
 
-@pytest.fixture
-def live_infer_client(live_settings: Settings) -> Infer:
+@pytest.fixture(scope="session")
+def live_infer_client(live_settings: Settings) -> Generator[Infer, None, None]:
     """Create Infer client for live server testing."""
-    return Infer(settings=live_settings)
+    client = Infer(settings=live_settings)
+    yield client
+    client.close()
 
 
 # ===========================
 # Common Dataset Fixtures
 # ===========================
+# Dataset CSV files are read-only inputs, so each one is written once per
+# session and shared by every test that needs it.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def small_classification_csv() -> Generator[str, None, None]:
     """Create a small classification dataset CSV file (3 molecules)."""
     csv_file = create_classification_csv(size="small")
@@ -239,7 +326,7 @@ def small_classification_csv() -> Generator[str, None, None]:
     cleanup_temp_file(csv_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_classification_csv() -> Generator[str, None, None]:
     """Create a minimal classification dataset CSV file (5 molecules)."""
     csv_file = create_classification_csv(size="minimal")
@@ -247,7 +334,7 @@ def minimal_classification_csv() -> Generator[str, None, None]:
     cleanup_temp_file(csv_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_classification_csv() -> Generator[str, None, None]:
     """Create a large classification dataset CSV file (15 molecules)."""
     csv_file = create_classification_csv(size="large")
@@ -255,7 +342,7 @@ def large_classification_csv() -> Generator[str, None, None]:
     cleanup_temp_file(csv_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_regression_csv() -> Generator[str, None, None]:
     """Create a simple regression dataset CSV file."""
     csv_file = create_regression_csv(complexity="simple", headers=["smiles", "property"])
@@ -263,7 +350,7 @@ def simple_regression_csv() -> Generator[str, None, None]:
     cleanup_temp_file(csv_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_regression_csv() -> Generator[str, None, None]:
     """Create a complex regression dataset CSV file."""
     csv_file = create_regression_csv(complexity="complex", headers=["smiles", "target"])
@@ -272,41 +359,315 @@ def complex_regression_csv() -> Generator[str, None, None]:
 
 
 @pytest.fixture
-def small_classification_data() -> list[tuple[str, int]]:
+def small_classification_data() -> tuple[tuple[str, int], ...]:
     """Get small classification dataset as raw data."""
     return get_small_classification_dataset()
 
 
 @pytest.fixture
-def minimal_classification_data() -> list[tuple[str, int]]:
+def minimal_classification_data() -> tuple[tuple[str, int], ...]:
     """Get minimal classification dataset as raw data."""
     return get_minimal_classification_dataset()
 
 
 @pytest.fixture
-def large_classification_data() -> list[tuple[str, int]]:
+def large_classification_data() -> tuple[tuple[str, int], ...]:
     """Get large classification dataset as raw data."""
     return get_large_classification_dataset()
 
 
 @pytest.fixture
-def simple_regression_data() -> list[tuple[str, float]]:
+def simple_regression_data() -> tuple[tuple[str, float], ...]:
     """Get simple regression dataset as raw data."""
     return get_simple_regression_dataset()
 
 
 @pytest.fixture
-def complex_regression_data() -> list[tuple[str, float]]:
+def complex_regression_data() -> tuple[tuple[str, float], ...]:
     """Get complex regression dataset as raw data."""
     return get_complex_regression_dataset()
 
 
-@pytest.fixture
-def live_data_client(live_settings: Settings) -> Data:
+@pytest.fixture(scope="session")
+def live_data_client(live_settings: Settings,
+                     cached_http_session: Optional[requests.Session]) -> Generator[Data, None, None]:
     """Create Data client for live server testing."""
-    return Data(settings=live_settings)
+    client = Data(settings=live_settings, session=cached_http_session)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def unique_name(worker_id: str) -> Callable[[str], str]:
+    """
+    Build unique names for objects created on the live server.
+
+    Names combine a per-session run id, the xdist worker id and a counter, so
+    they never collide across workers or across runs against the same server.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    counter = itertools.count()
+
+    def _unique_name(prefix: str) -> str:
+        return f"{prefix}_{run_id}_{worker_id}_{next(counter)}"
+
+    return _unique_name
+
+
+@pytest.fixture(scope="session")
+def run_once(tmp_path_factory: pytest.TempPathFactory, worker_id: str) -> Callable[[str, Callable[[], Any]], Any]:
+    """
+    Run expensive session setup once across all pytest-xdist workers.
+
+    The first worker to ask for a key runs the producer under a file lock and
+    stores its JSON-serializable result next to the per-worker temp
+    directories; other workers read the stored result instead.
+    """
+    shared_dir = tmp_path_factory.getbasetemp().parent
+
+    def _run_once(key: str, produce: Callable[[], Any]) -> Any:
+        if worker_id == "master":
+            return produce()
+
+        result_file = shared_dir / f"{key}.json"
+        with FileLock(f"{result_file}.lock"):
+            if result_file.is_file():
+                return json.loads(result_file.read_text())
+            result = produce()
+            result_file.write_text(json.dumps(result))
+        return result
+
+    return _run_once
+
+
+@pytest.fixture(scope="session")
+@debug_caching
+def uploaded_datasets(
+    live_data_client: Data,
+    unique_name: Callable[[str], str],
+    run_once: Callable[[str, Callable[[], Any]], Any],
+    large_classification_csv: str,
+    minimal_classification_csv: str,
+    simple_regression_csv: str,
+    complex_regression_csv: str,
+) -> Dict[str, str]:
+    """
+    Upload the shared training datasets to the live server once per session.
+
+    Uploads are issued concurrently, so the setup cost is bounded by the
+    slowest upload rather than the sum of all of them.
+
+    Returns:
+        Mapping of dataset name to its dataset address
+    """
+    csv_files = {
+        "large_classification": large_classification_csv,
+        "minimal_classification": minimal_classification_csv,
+        "simple_regression": simple_regression_csv,
+        "complex_regression": complex_regression_csv,
+    }
+
+    def upload_all() -> Dict[str, str]:
+        items = []
+        for name, file_path in csv_files.items():
+            items.append({
+                "file_path": file_path,
+                "filename": f"{unique_name(name)}.csv",
+                "description": f"Test data: {name}",
+            })
+        results = bulk_upload(live_data_client, items)
+
+        return {name: result["dataset_address"] for name, result in zip(csv_files, results)}
+
+    return run_once("uploaded_datasets", upload_all)
+
+
+@pytest.fixture(scope="session")
+def featurized_cache(pytestconfig: pytest.Config, live_server_url: str) -> Generator[Dict[str, str], None, None]:
+    """
+    Featurized dataset addresses keyed by their expected address.
+
+    Identical featurize jobs run only once per session. When the
+    DEBUG_CACHING environment variable is set, the entries are also kept as a
+    manifest in the pytest cache (one per live server), so later runs reuse
+    featurized datasets that already exist on the server; run with
+    --cache-clear after resetting the server's datastore.
+    """
+    cache = getattr(pytestconfig, "cache", None) if DEBUG_CACHING else None
+    cache_key = f"pyds/featurized/{content_hash(live_server_url)}"
+    manifest = dict(cache.get(cache_key, {})) if cache is not None else {}
+
+    yield manifest
+
+    if cache is not None:
+        # Merge rather than overwrite, other xdist workers may have saved entries
+        cache.set(cache_key, {**cache.get(cache_key, {}), **manifest})
+
+
+def _featurize_dataset(
+    featurized_cache: Dict[str, str],
+    featurize_client: Featurize,
+    dataset_address: str,
+    output_prefix: str,
+    label_column: str,
+    feat_kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Featurize an uploaded dataset with ECFP, reusing a previous result when possible.
+
+    The output name is derived from a hash of the featurization inputs, so
+    featurizing the same dataset address with the same parameters always
+    targets the same address. A recorded or already existing output is
+    reused instead of featurizing again.
+
+    Args:
+        featurized_cache: Featurized addresses keyed by their expected address
+        featurize_client: Featurize client used for featurization
+        dataset_address: Address of the uploaded dataset
+        output_prefix: Prefix of the featurized output name
+        label_column: Label column of the dataset
+        feat_kwargs: Featurizer keyword arguments
+
+    Returns:
+        Address of the featurized dataset
+    """
+    output = f"{output_prefix}_{content_hash(dataset_address, label_column, tuple(sorted((feat_kwargs or {}).items())))}"
+    settings = featurize_client.settings
+    address = f"deepchem://{settings.get_profile()}/{settings.get_project()}/{output}"
+
+    if address not in featurized_cache:
+        try:
+            featurize_result = featurize_client.run(
+                dataset_address=dataset_address,
+                featurizer="ecfp",
+                output=output,
+                dataset_column="smiles",
+                label_column=label_column,
+                feat_kwargs=feat_kwargs,
+            )
+            featurized_cache[address] = featurize_result["featurized_file_address"]
+        except Exception as e:
+            if "already exists" not in str(e):
+                raise
+            # Featurized by an earlier run that did not record it
+            featurized_cache[address] = address
+
+    return featurized_cache[address]
+
+
+@pytest.fixture(scope="session")
+@debug_caching
+def featurized_large_classification(
+    live_featurize_client: Featurize,
+    uploaded_datasets: Dict[str, str],
+    featurized_cache: Dict[str, str],
+    run_once: Callable[[str, Callable[[], Any]], Any],
+) -> str:
+    """Featurized address of the large classification dataset (ECFP, 1024 bits)."""
+    return run_once(
+        "featurized_large_classification",
+        lambda: _featurize_dataset(
+            featurized_cache,
+            live_featurize_client,
+            uploaded_datasets["large_classification"],
+            output_prefix="large_classification_feat",
+            label_column="label",
+            feat_kwargs={
+                "radius": 2,
+                "size": 1024
+            },
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+@debug_caching
+def featurized_minimal_classification(
+    live_featurize_client: Featurize,
+    uploaded_datasets: Dict[str, str],
+    featurized_cache: Dict[str, str],
+    run_once: Callable[[str, Callable[[], Any]], Any],
+) -> str:
+    """Featurized address of the minimal classification dataset (default ECFP)."""
+    return run_once(
+        "featurized_minimal_classification",
+        lambda: _featurize_dataset(
+            featurized_cache,
+            live_featurize_client,
+            uploaded_datasets["minimal_classification"],
+            output_prefix="minimal_classification_feat",
+            label_column="label",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+@debug_caching
+def featurized_simple_regression(
+    live_featurize_client: Featurize,
+    uploaded_datasets: Dict[str, str],
+    featurized_cache: Dict[str, str],
+    run_once: Callable[[str, Callable[[], Any]], Any],
+) -> str:
+    """Featurized address of the simple regression dataset (default ECFP)."""
+    return run_once(
+        "featurized_simple_regression",
+        lambda: _featurize_dataset(
+            featurized_cache,
+            live_featurize_client,
+            uploaded_datasets["simple_regression"],
+            output_prefix="simple_regression_feat",
+            label_column="property",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+@debug_caching
+def featurized_complex_regression(
+    live_featurize_client: Featurize,
+    uploaded_datasets: Dict[str, str],
+    featurized_cache: Dict[str, str],
+    run_once: Callable[[str, Callable[[], Any]], Any],
+) -> str:
+    """Featurized address of the complex regression dataset (ECFP, 512 bits)."""
+    return run_once(
+        "featurized_complex_regression",
+        lambda: _featurize_dataset(
+            featurized_cache,
+            live_featurize_client,
+            uploaded_datasets["complex_regression"],
+            output_prefix="complex_regression_feat",
+            label_column="target",
+            feat_kwargs={
+                "radius": 2,
+                "size": 512
+            },
+        ),
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
-    """Configure pytest markers."""
-    pass
+    """Configure pytest markers and the cache used by `debug_caching`."""
+    config.addinivalue_line(
+        "markers",
+        "parallel: independent live-server test that may run concurrently under pytest-xdist",
+    )
+    set_debug_cache(getattr(config, "cache", None))
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """
+    Pin live-server tests that are not marked ``parallel`` to a single xdist worker.
+
+    With ``--dist loadgroup`` the unit tests and the live-server tests marked
+    ``parallel`` fan out across workers, while the other live-server tests
+    (those using the ``live_server_url`` fixture) run serially in one shared
+    group.
+    """
+    if not config.pluginmanager.hasplugin("xdist") or not getattr(config.option, "numprocesses", None):
+        return
+
+    for item in items:
+        if "live_server_url" in getattr(item, "fixturenames", ()) and item.get_closest_marker("parallel") is None:
+            item.add_marker(pytest.mark.xdist_group("serial"))
@@ -7,9 +7,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import responses
 
-from pyds.base.client import BaseClient
+from pyds.base.client import BaseClient, POOL_CONNECTIONS, POOL_MAXSIZE, RETRY_BACKOFF_FACTOR
 from pyds.settings import Settings
 
 
@@ -24,6 +25,36 @@ class TestBaseClient:
         assert client.base_url == "http://localhost:8000"
         assert isinstance(client.session, requests.Session)
 
+    def test_init_mounts_pooled_adapter(self, base_client: BaseClient) -> None:
+        """Test BaseClient reuses pooled connections for HTTP and HTTPS without retrying by default."""
+        for prefix in ("http://", "https://"):
+            adapter = base_client.session.get_adapter(f"{prefix}localhost")
+            assert isinstance(adapter, HTTPAdapter)
+            assert adapter._pool_connections == POOL_CONNECTIONS
+            assert adapter._pool_maxsize == POOL_MAXSIZE
+            assert adapter.max_retries.total == 0
+
+    def test_init_with_max_retries(self, test_settings: Settings) -> None:
+        """Test BaseClient retries failed connections with backoff when asked to."""
+        client = BaseClient(settings=test_settings, max_retries=3)
+
+        adapter = client.session.get_adapter("http://localhost")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.backoff_factor == RETRY_BACKOFF_FACTOR
+        client.close()
+
+    def test_init_with_shared_session(self, test_settings: Settings) -> None:
+        """Test BaseClient uses a provided session and leaves it open on close."""
+        shared_session = Mock(spec=requests.Session)
+        client = BaseClient(settings=test_settings, session=shared_session)
+
+        assert client.session is shared_session
+
+        client.close()
+
+        shared_session.close.assert_not_called()
+
     def test_init_with_base_url_override(self, test_settings: Settings) -> None:
         """Test BaseClient initialization with base URL override."""
         custom_url = "http://custom:9000"
@@ -4,14 +4,17 @@ Unit tests for Data class.
 
 from pathlib import Path
 from typing import Any, Dict
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
+from requests_toolbelt import MultipartEncoder
 import responses
 
 from pyds.data import Data
 from pyds.settings import Settings
 
+from .test_utils import upload_cache_key
+
 
 class TestData:
     """Unit tests for Data class."""
@@ -195,6 +198,22 @@ class TestData:
 
         assert result == {"dataset_address": "test"}
 
+    def test_upload_data_streams_file(self, data_client: Data, temp_test_file: str) -> None:
+        """Test upload_data streams the file through a MultipartEncoder instead of reading it into memory."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"dataset_address": "test"}
+
+        with patch.object(data_client, "_post", return_value=mock_response) as mock_post:
+            data_client.upload_data(file_path=temp_test_file, filename="test.csv")
+
+        body = mock_post.call_args.kwargs["data"]
+        assert isinstance(body, MultipartEncoder)
+        assert mock_post.call_args.kwargs["headers"] == {"Content-Type": body.content_type}
+        filename, file_obj = body.fields["file"]
+        assert filename == "test.csv"
+        assert file_obj.name == temp_test_file
+
     @responses.activate
     def test_upload_data_no_description(self, data_client: Data, temp_test_file: str) -> None:
         """Test upload_data without description."""
@@ -211,3 +230,32 @@ class TestData:
         result = data_client.upload_data(file_path=temp_test_file)
 
         assert result == {"dataset_address": "test"}
+
+    @responses.activate
+    def test_upload_data_cached_session(self, test_settings: Settings, temp_test_file: str, tmp_path: Path) -> None:
+        """Test re-uploading the same file content is served from the HTTP cache."""
+        requests_cache = pytest.importorskip("requests_cache")
+        responses.add(
+            responses.POST,
+            "http://localhost:8000/data/uploaddata",
+            json={"dataset_address": "test"},
+            status=200,
+        )
+
+        with open(temp_test_file, "w") as f:
+            f.write("test,data\n1,2")
+
+        session = requests_cache.CachedSession(
+            cache_name=str(tmp_path / "reqs"),
+            backend="sqlite",
+            allowable_methods=("GET", "POST"),
+            key_fn=upload_cache_key,
+        )
+        client = Data(settings=test_settings, session=session)
+
+        first = client.upload_data(file_path=temp_test_file, filename="first.csv")
+        second = client.upload_data(file_path=temp_test_file, filename="second.csv")
+        session.close()
+
+        assert first == second == {"dataset_address": "test"}
+        assert len(responses.calls) == 1
@@ -2,8 +2,7 @@
 Unit tests for Docking primitive using live server.
 """
 
-import time
-import uuid
+from typing import Callable
 
 import pytest
 
@@ -25,6 +24,7 @@ class TestDocking:
         self,
         live_data_client: Data,
         test_settings: Settings,
+        unique_name: Callable[[str], str],
     ) -> None:
         """Test successful docking run on live server.
 
@@ -37,15 +37,12 @@ class TestDocking:
         protein_address = "test/protein.pdb"
         ligand_address = "test/ligand.sdf"
 
-        test_id = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time()))
-
         with pytest.raises(Exception):
             # Until valid addresses exist, server should error; ensures endpoint wiring
             client.run(
                 protein_address=protein_address,
                 ligand_address=ligand_address,
-                output=f"test_docking_{test_id}_{timestamp}",
+                output=unique_name("test_docking"),
                 exhaustiveness=8,
                 num_modes=5,
             )
@@ -2,8 +2,7 @@
 Unit tests for Featurize primitive using live server.
 """
 
-import time
-import uuid
+from typing import Callable
 
 import pytest
 
@@ -27,17 +26,14 @@ class TestFeaturize:
         live_featurize_client: Featurize,
         live_data_client: Data,
         small_classification_csv: str,
+        unique_name: Callable[[str], str],
     ) -> None:
         """Test successful featurize run on live server."""
-        # Generate unique identifiers to avoid naming conflicts
-        test_id = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time()))
-
         test_file = small_classification_csv
 
         upload_result = live_data_client.upload_data(
             file_path=test_file,
-            filename=f"test_featurize_{test_id}_{timestamp}.csv",
+            filename=f"{unique_name('test_featurize')}.csv",
             description="Test data for featurization",
         )
         dataset_address = upload_result["dataset_address"]
@@ -46,7 +42,7 @@ class TestFeaturize:
         result = live_featurize_client.run(
             dataset_address=dataset_address,
             featurizer="ecfp",
-            output=f"test_featurized_output_{test_id}_{timestamp}",
+            output=unique_name("test_featurized_output"),
             dataset_column="smiles",
             feat_kwargs={
                 "radius": 2,
@@ -62,17 +58,14 @@ class TestFeaturize:
         live_featurize_client: Featurize,
         live_data_client: Data,
         small_classification_csv: str,
+        unique_name: Callable[[str], str],
     ) -> None:
         """Test featurize run with default parameters on live server."""
-        # Generate unique identifiers to avoid naming conflicts
-        test_id = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time()))
-
         test_file = small_classification_csv
 
         upload_result = live_data_client.upload_data(
             file_path=test_file,
-            filename=f"test_featurize_defaults_{test_id}_{timestamp}.csv",
+            filename=f"{unique_name('test_featurize_defaults')}.csv",
             description="Test data for featurization with defaults",
         )
         dataset_address = upload_result["dataset_address"]
@@ -81,7 +74,7 @@ class TestFeaturize:
         result = live_featurize_client.run(
             dataset_address=dataset_address,
             featurizer="ecfp",
-            output=f"test_featurized_defaults_{test_id}_{timestamp}",
+            output=unique_name("test_featurized_defaults"),
             dataset_column="smiles",
         )
 
@@ -92,17 +85,14 @@ class TestFeaturize:
         live_featurize_client: Featurize,
         live_data_client: Data,
         small_classification_csv: str,
+        unique_name: Callable[[str], str],
     ) -> None:
         """Test featurize run with profile and project override on live server."""
-        # Generate unique identifiers to avoid naming conflicts
-        test_id = str(uuid.uuid4())[:8]
-        timestamp = str(int(time.time()))
-
         test_file = small_classification_csv
 
         upload_result = live_data_client.upload_data(
             file_path=test_file,
-            filename=f"test_featurize_override_{test_id}_{timestamp}.csv",
+            filename=f"{unique_name('test_featurize_override')}.csv",
             description="Test data for featurization with override",
         )
         dataset_address = upload_result["dataset_address"]
@@ -111,7 +101,7 @@ class TestFeaturize:
         result = live_featurize_client.run(
             dataset_address=dataset_address,
             featurizer="ecfp",
-            output=f"test_featurized_override_{test_id}_{timestamp}",
+            output=unique_name("test_featurized_override"),
             dataset_column="smiles",
             profile_name="test_profile",
             project_name="test_project",
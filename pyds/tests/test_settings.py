@@ -2,14 +2,38 @@
 Unit tests for Settings class.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import glob
 import json
+import logging
+import math
 import os
 from pathlib import Path
+import subprocess
+import sys
 import tempfile
+import threading
+import time
 from typing import Any
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
-from pyds.settings import Settings
+import pytest
+
+from pyds.settings import InMemoryStore, JSONFileStore, Settings, STALE_TMP_FILE_AGE
+
+
+@functools.lru_cache(maxsize=None)
+def _expected_str(profile: str, project: str, base_url: str) -> str:
+    """Build the expected str() of a Settings instance."""
+    return f"Settings(profile='{profile}', project='{project}', base_url='{base_url}')"
+
+
+@functools.lru_cache(maxsize=None)
+def _expected_repr(profile: str, project: str, base_url: str, settings_file: str) -> str:
+    """Build the expected repr() of a Settings instance."""
+    return (f"Settings(profile='{profile}', project='{project}', "
+            f"base_url='{base_url}', settings_file='{settings_file}')")
 
 
 class TestSettings:
@@ -40,43 +64,43 @@ class TestSettings:
         assert settings.base_url == "http://custom:9000"
         assert settings._additional_settings == additional
 
-    def test_set_profile(self, test_settings: Settings) -> None:
+    def test_set_profile(self, in_memory_settings: Settings) -> None:
         """Test set_profile method."""
-        test_settings.set_profile("new_profile")
+        in_memory_settings.set_profile("new_profile")
 
-        assert test_settings.profile == "new_profile"
+        assert in_memory_settings.profile == "new_profile"
 
-    def test_set_project(self, test_settings: Settings) -> None:
+    def test_set_project(self, in_memory_settings: Settings) -> None:
         """Test set_project method."""
-        test_settings.set_project("new_project")
+        in_memory_settings.set_project("new_project")
 
-        assert test_settings.project == "new_project"
+        assert in_memory_settings.project == "new_project"
 
-    def test_set_base_url(self, test_settings: Settings) -> None:
+    def test_set_base_url(self, in_memory_settings: Settings) -> None:
         """Test set_base_url method."""
-        test_settings.set_base_url("http://newserver:8080/")
+        in_memory_settings.set_base_url("http://newserver:8080/")
 
         # Should strip trailing slash
-        assert test_settings.base_url == "http://newserver:8080"
+        assert in_memory_settings.base_url == "http://newserver:8080"
 
-    def test_get_profile(self, test_settings: Settings) -> None:
+    def test_get_profile(self, in_memory_settings: Settings) -> None:
         """Test get_profile method."""
-        assert test_settings.get_profile() == "test_profile"
+        assert in_memory_settings.get_profile() == "test_profile"
 
-    def test_get_project(self, test_settings: Settings) -> None:
+    def test_get_project(self, in_memory_settings: Settings) -> None:
         """Test get_project method."""
-        assert test_settings.get_project() == "test_project"
+        assert in_memory_settings.get_project() == "test_project"
 
-    def test_get_base_url(self, test_settings: Settings) -> None:
+    def test_get_base_url(self, in_memory_settings: Settings) -> None:
         """Test get_base_url method."""
-        assert test_settings.get_base_url() == "http://localhost:8000"
+        assert in_memory_settings.get_base_url() == "http://localhost:8000"
 
-    def test_set_get_setting(self, test_settings: Settings) -> None:
+    def test_set_get_setting(self, in_memory_settings: Settings) -> None:
         """Test set_setting and get_setting methods."""
-        test_settings.set_setting("custom_key", "custom_value")
+        in_memory_settings.set_setting("custom_key", "custom_value")
 
-        assert test_settings.get_setting("custom_key") == "custom_value"
-        assert test_settings.get_setting("nonexistent", "default") == "default"
+        assert in_memory_settings.get_setting("custom_key") == "custom_value"
+        assert in_memory_settings.get_setting("nonexistent", "default") == "default"
 
     def test_touch_creates_file(self, temp_settings_file: str) -> None:
         """Test touch method creates settings file."""
@@ -125,27 +149,37 @@ class TestSettings:
         assert settings.profile is None
         assert settings.project is None
 
-    def test_load_invalid_json(self, temp_settings_file: str) -> None:
+    def test_load_invalid_json(self, temp_settings_file: str, caplog: pytest.LogCaptureFixture) -> None:
         """Test load method with invalid JSON."""
         with open(temp_settings_file, "w") as f:
             f.write("invalid json content")
 
-        with patch("builtins.print") as mock_print:
+        with caplog.at_level(logging.WARNING, logger="pyds.settings"):
             settings = Settings(settings_file=temp_settings_file)
-            mock_print.assert_called()
+
+        assert any("could not load settings" in r.message.lower() for r in caplog.records)
 
         # Should maintain defaults
         assert settings.profile is None
         assert settings.project is None
 
-    def test_save_permission_error(self, test_settings: Settings) -> None:
+    def test_save_permission_error(
+        self,
+        test_settings: Settings,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
         """Test save method with permission error."""
-        with patch("builtins.open", mock_open()) as mock_file:
-            mock_file.side_effect = PermissionError("Permission denied")
 
-            with patch("builtins.print") as mock_print:
-                test_settings.save()
-                mock_print.assert_called()
+        def faulty_open(*args: Any, **kwargs: Any) -> Any:
+            raise PermissionError("Permission denied")
+
+        monkeypatch.setattr("pyds.settings.open", faulty_open, raising=False)
+
+        with caplog.at_level(logging.WARNING, logger="pyds.settings"):
+            test_settings.save()
+
+        assert any("could not save settings" in r.message.lower() for r in caplog.records)
 
     def test_reset(self, test_settings: Settings) -> None:
         """Test reset method."""
@@ -159,42 +193,45 @@ class TestSettings:
         assert test_settings._additional_settings == {}
         assert not settings_file.exists()
 
-    def test_reset_file_removal_error(self, test_settings: Settings) -> None:
+    def test_reset_file_removal_error(self, test_settings: Settings, caplog: pytest.LogCaptureFixture) -> None:
         """Test reset method with file removal error."""
         with patch("os.remove", side_effect=PermissionError("Permission denied")):
-            with patch("builtins.print") as mock_print:
+            with caplog.at_level(logging.WARNING, logger="pyds.settings"):
                 test_settings.reset()
-                mock_print.assert_called()
-
-    def test_is_configured_true(self, test_settings: Settings) -> None:
-        """Test is_configured returns True when both profile and project are set."""
-        assert test_settings.is_configured() is True
 
-    def test_is_configured_false_no_profile(self, temp_settings_file: str) -> None:
-        """Test is_configured returns False when profile is missing."""
-        settings = Settings(settings_file=temp_settings_file, project="test_project")
-        assert settings.is_configured() is False
-
-    def test_is_configured_false_no_project(self, temp_settings_file: str) -> None:
-        """Test is_configured returns False when project is missing."""
-        settings = Settings(settings_file=temp_settings_file, profile="test_profile")
-        assert settings.is_configured() is False
-
-    def test_is_configured_false_both_missing(self, temp_settings_file: str) -> None:
-        """Test is_configured returns False when both are missing."""
-        settings = Settings(settings_file=temp_settings_file)
-        assert settings.is_configured() is False
-
-    def test_str_representation(self, test_settings: Settings) -> None:
+        assert any("could not remove settings file" in r.message.lower() for r in caplog.records)
+
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            ({
+                "profile": "test_profile",
+                "project": "test_project"
+            }, True),
+            ({
+                "project": "test_project"
+            }, False),
+            ({
+                "profile": "test_profile"
+            }, False),
+            ({}, False),
+        ],
+        ids=["configured", "no_profile", "no_project", "both_missing"],
+    )
+    def test_is_configured(self, kwargs: dict[str, Any], expected: bool) -> None:
+        """Test is_configured requires both profile and project to be set."""
+        settings = Settings(store=InMemoryStore(), **kwargs)
+        assert settings.is_configured() is expected
+
+    def test_str_representation(self, in_memory_settings: Settings) -> None:
         """Test string representation."""
-        expected = "Settings(profile='test_profile', project='test_project', base_url='http://localhost:8000')"
-        assert str(test_settings) == expected
+        expected = _expected_str("test_profile", "test_project", "http://localhost:8000")
+        assert str(in_memory_settings) == expected
 
     def test_repr_representation(self, test_settings: Settings) -> None:
         """Test detailed representation."""
         settings_file = test_settings.settings_file
-        expected = (f"Settings(profile='test_profile', project='test_project', "
-                    f"base_url='http://localhost:8000', settings_file='{settings_file}')")
+        expected = _expected_repr("test_profile", "test_project", "http://localhost:8000", str(settings_file))
         assert repr(test_settings) == expected
 
     def test_init_file_creation_when_not_exists(self) -> None:
@@ -236,3 +273,185 @@ class TestSettings:
         settings = Settings(settings_file=temp_settings_file)
 
         assert settings.base_url == "http://localhost:8000"
+
+    def test_load_reuses_parsed_file(self, temp_settings_file: str) -> None:
+        """Test load reuses the parsed settings when the file is unchanged."""
+        Settings(settings_file=temp_settings_file, profile="cached_profile", project="cached_project")
+
+        with patch("pyds.settings._loads_json") as mock_load:
+            settings = Settings(settings_file=temp_settings_file)
+            mock_load.assert_not_called()
+
+        assert settings.profile == "cached_profile"
+        assert settings.project == "cached_project"
+
+    def test_load_detects_external_changes(self, temp_settings_file: str) -> None:
+        """Test load re-parses the settings file after it is modified externally."""
+        Settings(settings_file=temp_settings_file, profile="old_profile")
+
+        data: dict[str, Any] = {"profile": "external_profile", "project": None, "additional_settings": {}}
+        with open(temp_settings_file, "w") as f:
+            json.dump(data, f)
+
+        settings = Settings(settings_file=temp_settings_file)
+
+        assert settings.profile == "external_profile"
+
+    def test_cached_additional_settings_not_shared(self, temp_settings_file: str) -> None:
+        """Test instances loaded from the cache do not share additional settings."""
+        first = Settings(settings_file=temp_settings_file, additional_settings={"key": "value"})
+        second = Settings(settings_file=temp_settings_file)
+
+        second._additional_settings["key"] = "changed"
+
+        assert first.get_setting("key") == "value"
+        assert Settings(settings_file=temp_settings_file).get_setting("key") == "value"
+
+    def test_cached_settings_match_file(self, temp_settings_file: str) -> None:
+        """Test settings loaded from the cache match those parsed from the file."""
+        settings = Settings(settings_file=temp_settings_file)
+        settings.set_setting("pair", (1, 2))
+
+        with open(temp_settings_file) as f:
+            file_data = json.load(f)
+
+        assert Settings(settings_file=temp_settings_file).get_setting("pair") == [1, 2]
+        assert file_data["additional_settings"]["pair"] == [1, 2]
+
+    def test_save_non_str_keys(self, temp_settings_file: str) -> None:
+        """Test dict settings with non-string keys are saved with string keys."""
+        settings = Settings(settings_file=temp_settings_file)
+        settings.set_setting("ids", {1: "one"})
+
+        with open(temp_settings_file) as f:
+            file_data = json.load(f)
+
+        assert file_data["additional_settings"]["ids"] == {"1": "one"}
+        assert Settings(settings_file=temp_settings_file).get_setting("ids") == {"1": "one"}
+
+    def test_save_wide_int(self, temp_settings_file: str) -> None:
+        """Test integers wider than 64 bits are saved."""
+        settings = Settings(settings_file=temp_settings_file)
+        settings.set_setting("wide", 2**70)
+
+        assert Settings(settings_file=temp_settings_file).get_setting("wide") == 2**70
+
+    def test_save_non_finite_floats(self, temp_settings_file: str) -> None:
+        """Test NaN and infinite floats are saved and loaded back."""
+        settings = Settings(settings_file=temp_settings_file)
+        settings.set_setting("inf", float("inf"))
+        settings.set_setting("nan", float("nan"))
+
+        loaded = Settings(settings_file=temp_settings_file)
+        assert loaded.get_setting("inf") == float("inf")
+        assert math.isnan(loaded.get_setting("nan"))
+
+    def test_load_non_finite_floats(self, temp_settings_file: str) -> None:
+        """Test a settings file with the NaN and Infinity values json writes is loaded."""
+        with open(temp_settings_file, "w") as f:
+            f.write('{"profile": "nan_profile", "project": "nan_project", "base_url": "http://localhost:8000", '
+                    '"additional_settings": {"x": NaN, "y": Infinity, "z": -Infinity}}')
+
+        settings = Settings(settings_file=temp_settings_file)
+
+        assert settings.profile == "nan_profile"
+        assert settings.project == "nan_project"
+        assert math.isnan(settings.get_setting("x"))
+        assert settings.get_setting("y") == float("inf")
+        assert settings.get_setting("z") == float("-inf")
+
+    def test_cached_nested_settings_not_shared(self, temp_settings_file: str) -> None:
+        """Test nested setting values are not shared between loaded instances."""
+        Settings(settings_file=temp_settings_file, additional_settings={"nested": {"key": "value"}})
+
+        Settings(settings_file=temp_settings_file).get_setting("nested")["key"] = "changed"
+
+        assert Settings(settings_file=temp_settings_file).get_setting("nested") == {"key": "value"}
+
+    def test_save_leaves_no_tmp_files(self, test_settings: Settings) -> None:
+        """Test save writes atomically without leaving temporary files behind."""
+        test_settings.set_profile("atomic_profile")
+
+        assert glob.glob(f"{test_settings.settings_file}*.tmp") == []
+        assert Settings(settings_file=str(test_settings.settings_file)).profile == "atomic_profile"
+
+    def test_concurrent_writes(self, temp_settings_file: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test writes from two threads at the same time do not interfere with each other."""
+        store = JSONFileStore(temp_settings_file)
+        # Hold both writes between writing and replacing their temporary file
+        both_writing = threading.Barrier(2, timeout=10)
+        fsync = os.fsync
+
+        def synced_fsync(fd: int) -> None:
+            both_writing.wait()
+            fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", synced_fsync)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(store.write, {"profile": f"profile_{i}"}) for i in range(2)]
+            # result() re-raises any error from the write
+            for future in futures:
+                future.result()
+
+        with open(temp_settings_file) as f:
+            assert json.load(f)["profile"] in ("profile_0", "profile_1")
+        assert glob.glob(f"{temp_settings_file}*.tmp") == []
+
+    def test_load_removes_stale_tmp_files(self, temp_settings_file: str) -> None:
+        """Test load removes old temporary files left by interrupted writes."""
+        stale_tmp_file = f"{temp_settings_file}.{os.getppid()}.a1b2c3.tmp"
+        with open(stale_tmp_file, "w") as f:
+            f.write('{"profile": "partial')
+        old = time.time() - STALE_TMP_FILE_AGE - 60
+        os.utime(stale_tmp_file, (old, old))
+
+        Settings(settings_file=temp_settings_file)
+
+        assert not os.path.exists(stale_tmp_file)
+
+    @pytest.mark.skipif(os.name != "posix", reason="writer pids are only checked on POSIX")
+    def test_load_removes_tmp_files_of_exited_writers(self, temp_settings_file: str) -> None:
+        """Test load removes temporary files whose writer process has exited."""
+        writer = subprocess.Popen([sys.executable, "-c", ""])
+        writer.wait()
+        stale_tmp_file = f"{temp_settings_file}.{writer.pid}.a1b2c3.tmp"
+        with open(stale_tmp_file, "w") as f:
+            f.write('{"profile": "partial')
+
+        Settings(settings_file=temp_settings_file)
+
+        assert not os.path.exists(stale_tmp_file)
+
+    def test_load_keeps_tmp_files_of_running_writers(self, temp_settings_file: str) -> None:
+        """Test load keeps recent temporary files that a running process may still be writing."""
+        active_tmp_file = f"{temp_settings_file}.{os.getppid()}.a1b2c3.tmp"
+        with open(active_tmp_file, "w") as f:
+            f.write('{"profile": "partial')
+
+        Settings(settings_file=temp_settings_file)
+
+        assert os.path.exists(active_tmp_file)
+        os.remove(active_tmp_file)
+
+    def test_in_memory_store_round_trip(self, temp_settings_file: str) -> None:
+        """Test settings persist across instances sharing an in-memory store."""
+        os.remove(temp_settings_file)
+        store = InMemoryStore()
+
+        settings = Settings(settings_file=temp_settings_file, store=store, profile="memory_profile")
+        settings.set_setting("memory_key", "memory_value")
+        new_settings = Settings(settings_file=temp_settings_file, store=store)
+
+        assert new_settings.profile == "memory_profile"
+        assert new_settings.get_setting("memory_key") == "memory_value"
+        assert not os.path.exists(temp_settings_file)
+
+    def test_in_memory_store_reset(self) -> None:
+        """Test reset clears an in-memory store."""
+        store = InMemoryStore()
+        settings = Settings(store=store, profile="memory_profile")
+
+        settings.reset()
+
+        assert not store.exists()
@@ -0,0 +1,263 @@
+"""
+Unit tests for the test helpers in test_utils.
+"""
+
+import csv
+import gc
+import io
+import json
+import os
+from typing import Any, List
+
+import pytest
+import requests
+
+from . import test_utils
+from .test_utils import (
+    cleanup_temp_file,
+    create_test_csv_file,
+    create_test_sdf_file,
+    create_test_settings_file,
+    DataManager,
+    skip_if_server_unavailable,
+)
+
+
+def _csv_writer_bytes(headers: List[Any], rows: List[Any]) -> bytes:
+    """Format rows with csv.writer, the reference for the CSV fast paths."""
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    writer.writerows(row if isinstance(row, (list, tuple)) else [row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """Read a file's raw contents."""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+class TestFileCreators:
+    """Unit tests for the CSV and SDF file creators."""
+
+    @pytest.mark.parametrize(
+        "headers, rows",
+        [
+            # (smiles, label) pairs
+            (["smiles", "label"], [("CCO", 1), ("CCC", 0), ("C", -3)]),
+            (["smiles", "target"], [("CCO", 0.1), ("CCC", 1e-07), ("C", 2.0)]),
+            # Cells the pair path leaves to the plain or csv.writer paths
+            (["smiles", "label"], [("CCO", True), ("CCC", False)]),
+            (["smiles", "label"], [("CCO", None), ("", 1)]),
+            (["smiles", "label"], [("C,C", 1), ('C"O', 0), ("C\nO", 1), ("C\rO", 0)]),
+            (["smiles", "la,bel"], [("CCO", 1)]),
+            # More columns and single values
+            (["smiles", "label", "weight"], [("CCO", 1, 0.5), ("CCC", 0, 2)]),
+            (["smiles"], ["CCO", "CCC"]),
+        ],
+    )
+    def test_create_test_csv_file_matches_csv_writer(self, headers: List[str], rows: List[Any]) -> None:
+        """Test every CSV writing path produces exactly the bytes csv.writer does."""
+        assert _read_bytes(create_test_csv_file(rows, headers)) == _csv_writer_bytes(headers, rows)
+
+    def test_format_label_pairs_rejects_other_shapes(self) -> None:
+        """Test the (smiles, label) fast path only accepts plain string and number pairs."""
+        assert test_utils._format_label_pairs(["smiles", "label"], [("CCO", 1)]) == b"smiles,label\r\nCCO,1\r\n"
+        assert test_utils._format_label_pairs(["smiles", "label"], [("CCO", True)]) is None
+        assert test_utils._format_label_pairs(["smiles", "label"], [("C,O", 1)]) is None
+        assert test_utils._format_label_pairs(["smiles", "label"], [("CCO", 1, 2)]) is None
+        assert test_utils._format_label_pairs(["smiles", "label", "x"], [("CCO", 1)]) is None
+
+    def test_is_plain_csv(self) -> None:
+        """Test cells that csv.writer would quote or format specially are detected."""
+        assert test_utils._is_plain_csv([["smiles", "label"], ["CCO", 1], ["CCC", 0.5]])
+        for cell in ["", "a,b", 'a"b', "a\nb", "a\rb", None, True]:
+            assert not test_utils._is_plain_csv([["CCO", cell]])
+
+    def test_create_test_sdf_file_format(self) -> None:
+        """Test SDF files are written in the simplified record format."""
+        molecules = ["CCO", "c1ccccc1"]
+        expected = "".join(f"Molecule_{i}\n"
+                           "  -OEChem-01010000002D\n"
+                           f"  {len(mol)} 0  0     0  0            999 V2000\n"
+                           f"{mol}\n"
+                           "M  END\n"
+                           "$$$$\n" for i, mol in enumerate(molecules))
+
+        assert _read_bytes(create_test_sdf_file(molecules)) == expected.encode()
+
+
+class TestCreateTestSettingsFile:
+    """Unit tests for create_test_settings_file."""
+
+    def test_settings_file_contents(self) -> None:
+        """Test the settings file holds the given settings."""
+        file_path = create_test_settings_file(profile="profile", project="project", key="value")
+
+        with open(file_path) as f:
+            assert json.load(f) == {
+                "profile": "profile",
+                "project": "project",
+                "base_url": "http://localhost:8000",
+                "additional_settings": {
+                    "key": "value"
+                },
+            }
+        cleanup_temp_file(file_path)
+
+    def test_wide_int(self) -> None:
+        """Test integers wider than 64 bits are written."""
+        file_path = create_test_settings_file(big=2**70)
+
+        with open(file_path) as f:
+            assert json.load(f)["additional_settings"] == {"big": 2**70}
+        cleanup_temp_file(file_path)
+
+    def test_non_str_keys(self) -> None:
+        """Test non-string dict keys in unhashable settings are written as strings."""
+        file_path = create_test_settings_file(k={1: "x"})
+
+        with open(file_path) as f:
+            assert json.load(f)["additional_settings"] == {"k": {"1": "x"}}
+        cleanup_temp_file(file_path)
+
+
+class TestCachedFile:
+    """Unit tests for the shared files of the file creators."""
+
+    def test_identical_inputs_share_a_file(self) -> None:
+        """Test identical inputs return the same file and different inputs do not."""
+        rows = [("CCO", 1), ("CCC", 0)]
+
+        assert create_test_csv_file(rows) == create_test_csv_file(list(rows))
+        assert create_test_csv_file(rows) != create_test_csv_file(rows, ["smiles", "target"])
+
+    def test_removed_shared_file_is_rewritten(self) -> None:
+        """Test a shared file removed by a caller is written again."""
+        rows = [("CCO", 1), ("CCCC", 0)]
+        file_path = create_test_csv_file(rows)
+        os.remove(file_path)
+
+        assert _read_bytes(create_test_csv_file(rows)) == _csv_writer_bytes(["smiles", "label"], rows)
+
+    def test_unique_file_is_independent(self) -> None:
+        """Test modifying or removing a unique file leaves the shared file intact."""
+        rows = [("CCO", 1), ("CCCCC", 0)]
+        shared_path = create_test_csv_file(rows)
+        unique_path = create_test_csv_file(rows, unique=True)
+
+        with open(unique_path, "w") as f:
+            f.write("modified")
+        cleanup_temp_file(unique_path)
+
+        assert unique_path != shared_path
+        assert _read_bytes(create_test_csv_file(rows)) == _csv_writer_bytes(["smiles", "label"], rows)
+
+
+class TestDataManager:
+    """Unit tests for DataManager."""
+
+    def test_files_are_independent_of_shared_files(self) -> None:
+        """Test modifying a managed file leaves the shared file with the same content intact."""
+        rows = [("CCO", 1), ("CCCCCC", 0)]
+        with DataManager() as manager:
+            managed_path = manager.create_csv_file(rows)
+            with open(managed_path, "w") as f:
+                f.write("modified")
+
+            assert _read_bytes(create_test_csv_file(rows)) == _csv_writer_bytes(["smiles", "label"], rows)
+
+    def test_isolated_dataset_file_is_a_tracked_copy(self) -> None:
+        """Test an isolated dataset file is a tracked copy of the shared one."""
+        with DataManager() as manager:
+            shared_path = manager.create_dataset_file(count=4)
+            isolated_path = manager.create_dataset_file(count=4, isolated=True)
+
+            assert isolated_path != shared_path
+            assert isolated_path in manager.temp_files
+            assert _read_bytes(isolated_path) == _read_bytes(shared_path)
+
+    def test_cleanup_all_removes_files(self) -> None:
+        """Test cleanup_all removes the managed files and later files can still be created."""
+        manager = DataManager()
+        file_paths = [
+            manager.create_csv_file([("CCO", 1)]),
+            manager.create_sdf_file(["CCO"]),
+            manager.create_settings_file(profile="profile"),
+        ]
+
+        manager.cleanup_all()
+
+        assert not any(os.path.exists(file_path) for file_path in file_paths)
+        assert manager.temp_files == []
+        new_path = manager.create_csv_file([("CCO", 1)])
+        assert os.path.exists(new_path)
+        manager.cleanup_all()
+        assert not os.path.exists(new_path)
+
+    def test_context_manager_cleans_up(self) -> None:
+        """Test leaving the context removes the managed files."""
+        with DataManager() as manager:
+            file_path = manager.create_csv_file([("CCO", 1)])
+
+        assert not os.path.exists(file_path)
+
+    def test_unreferenced_manager_removes_its_files(self) -> None:
+        """Test a manager that is never cleaned up removes its files when collected."""
+        manager = DataManager()
+        file_path = manager.create_csv_file([("CCO", 1)])
+
+        del manager
+        gc.collect()
+
+        assert not os.path.exists(file_path)
+
+
+class TestSkipIfServerUnavailable:
+    """Unit tests for the skip_if_server_unavailable decorator."""
+
+    @pytest.fixture(autouse=True)
+    def server_state(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Start each test with the server considered reachable."""
+        monkeypatch.setitem(test_utils._SERVER_STATE, "unreachable", False)
+
+    def test_connection_error_skips_later_tests(self) -> None:
+        """Test a failed connection marks the server unreachable for later tests."""
+
+        @skip_if_server_unavailable
+        def failing_request() -> None:
+            try:
+                raise requests.ConnectionError("Connection refused")
+            except requests.ConnectionError as e:
+                # Clients re-raise request errors as plain exceptions
+                raise Exception(f"API request failed: {e}")
+
+        with pytest.raises(pytest.skip.Exception):
+            failing_request()
+
+        assert test_utils._SERVER_STATE["unreachable"]
+
+    def test_unavailable_response_skips_only_current_test(self) -> None:
+        """Test an error that only mentions a network keyword does not skip later tests."""
+
+        @skip_if_server_unavailable
+        def failing_request() -> None:
+            raise Exception("API request failed: 503 Service Unavailable")
+
+        with pytest.raises(pytest.skip.Exception):
+            failing_request()
+
+        assert not test_utils._SERVER_STATE["unreachable"]
+
+    def test_other_errors_are_raised(self) -> None:
+        """Test errors unrelated to the server are raised."""
+
+        @skip_if_server_unavailable
+        def failing_test() -> None:
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError, match="bad input"):
+            failing_test()
+
+        assert not test_utils._SERVER_STATE["unreachable"]
@@ -1,56 +1,273 @@
 """
 Test utilities and helper functions.
 """
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import csv
+import functools
+import hashlib
+from itertools import count, cycle, islice
 import json
 import os
+import re
+import shutil
 import tempfile
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, IO, Iterable, List, Optional, Tuple
+import weakref
 
+from filelock import FileLock
+import requests
+from requests_toolbelt import MultipartEncoder
 
-def create_test_csv_file(data_rows: list, headers: Optional[list] = None, suffix: str = ".csv") -> str:
+from pyds.base.client import BaseClient
+
+
+_COUNTER = count()  # Numbers the temporary files of this process, see _mkpath
+
+# Use orjson for test settings files when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    ORJSON_AVAILABLE = False
+
+# Directory for generated test files: RAM-backed /dev/shm where available,
+# unless TMPDIR is set explicitly
+if "TMPDIR" not in os.environ and os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+    _TMPDIR = "/dev/shm"
+else:
+    _TMPDIR = tempfile.gettempdir()
+
+
+def _mkpath(suffix: str) -> str:
+    """
+    Get a new temporary file path in _TMPDIR.
+
+    Args:
+        suffix: File suffix
+
+    Returns:
+        Path that no earlier call in this process has returned
+    """
+    return os.path.join(_TMPDIR, f"pyds_{os.getpid()}_{next(_COUNTER)}{suffix}")
+
+
+def _fast_temp(suffix: str, mode: str = "w") -> Tuple[IO, str]:
+    """
+    Create a temporary file in _TMPDIR without the NamedTemporaryFile wrapper.
+
+    Args:
+        suffix: File suffix
+        mode: Mode to open the file with
+
+    Returns:
+        Open file object (with a 1 MiB buffer) and its path; the caller closes
+        and removes the file
+    """
+    while True:
+        file_path = _mkpath(suffix)
+        try:
+            # Exclusive creation, so a file left by an earlier process with
+            # the same pid is skipped rather than overwritten
+            return open(file_path, mode.replace("w", "x"), buffering=1 << 20), file_path
+        except FileExistsError:
+            continue
+
+
+# Canonical generated files, keyed by a hash of the inputs that produced them
+_FILE_CACHE: Dict[str, str] = {}
+
+
+def _cached_file(key_data: Any,
+                 suffix: str,
+                 write: Callable[[str], None],
+                 unique: bool = False,
+                 path: Optional[str] = None) -> str:
+    """
+    Get the canonical file for the given inputs, writing it only once per process.
+
+    Args:
+        key_data: Inputs that fully determine the file contents
+        suffix: File suffix
+        write: Function writing the file contents to the given path
+        unique: Return a new copy of the canonical file instead of its path
+        path: Create the copy at this path instead of a new temporary one
+
+    Returns:
+        Path to the canonical file, or to a new copy of it if `unique` or
+        `path` is set
+    """
+    key = hashlib.blake2b(repr((key_data, suffix)).encode(), digest_size=16).hexdigest()
+    file_path = _FILE_CACHE.get(key)
+    if file_path is None or not os.path.exists(file_path):
+        # The pid keeps processes sharing the temp dir (e.g. xdist workers) apart
+        file_path = os.path.join(_TMPDIR, f"pyds_test_{os.getpid()}_{key}{suffix}")
+        write(file_path)
+        _FILE_CACHE[key] = file_path
+
+    if path is None and not unique:
+        return file_path
+    return _copy_file(file_path, suffix, path)
+
+
+def _copy_file(file_path: str, suffix: str, path: Optional[str] = None) -> str:
+    """
+    Copy a file to a new caller-owned path.
+
+    Args:
+        file_path: File to copy
+        suffix: File suffix for a new temporary path
+        path: Create the copy at this path instead of a new temporary one
+
+    Returns:
+        Path to the copy, which may be modified or removed without affecting
+        `file_path`
+    """
+    if path is None:
+        f, path = _fast_temp(suffix)
+        f.close()
+    shutil.copyfile(file_path, path)
+    return path
+
+
+@atexit.register
+def _cleanup_file_cache() -> None:
+    """Remove the canonical generated files."""
+    for file_path in _FILE_CACHE.values():
+        cleanup_temp_file(file_path)
+    _FILE_CACHE.clear()
+
+
+def create_test_csv_file(data_rows: Iterable,
+                         headers: Optional[list] = None,
+                         suffix: str = ".csv",
+                         unique: bool = False,
+                         path: Optional[str] = None) -> str:
     """
     Create a temporary CSV file with test data.
 
+    Identical inputs return the same shared file, which must not be modified
+    or removed by callers. With `unique` or `path`, the caller gets its own
+    copy, which it may modify or remove.
+
     Args:
-        data_rows: List of data rows to write
+        data_rows: Data rows (sequences or single values) to write
         headers: Column headers (default: ["smiles", "label"])
         suffix: File suffix (default: .csv)
+        unique: Return a path owned by the caller (default: False)
+        path: Caller-owned path to create the file at (default: a temporary file)
 
     Returns:
         Path to the created temporary file
     """
     if headers is None:
         headers = ["smiles", "label"]
+    if not isinstance(data_rows, (list, tuple)):
+        # Iterators can only be consumed once, and their repr is not a cache key
+        data_rows = list(data_rows)
+
+    def write(file_path: str) -> None:
+        pairs = _format_label_pairs(headers, data_rows)
+        if pairs is not None:
+            with open(file_path, "wb") as f:
+                f.write(pairs)
+            return
+        # Single values are written as one-column rows
+        rows = [headers] + [row if isinstance(row, (list, tuple)) else [row] for row in data_rows]
+        with open(file_path, "w", newline="", buffering=1 << 20) as f:
+            if _is_plain_csv(rows):
+                # Nothing needs quoting, so format the file as one string with
+                # the same line endings as csv.writer
+                f.write("".join(",".join(map(str, row)) + "\r\n" for row in rows))
+            else:
+                csv.writer(f).writerows(rows)
+
+    return _cached_file((headers, data_rows), suffix, write, unique, path)
+
+
+def _format_label_pairs(headers: list, data_rows: Iterable) -> Optional[bytes]:
+    """
+    Format the common (smiles, label) fixture shape without csv quoting.
+
+    Args:
+        headers: Column headers
+        data_rows: Data rows to format
+
+    Returns:
+        The encoded file contents, or None if the headers are not two plain
+        strings or any row is not a plain string paired with an int or float
+    """
+    if len(headers) != 2 or not _is_plain_csv([headers]):
+        return None
+    lines = [f"{headers[0]},{headers[1]}\r\n"]
+    for row in data_rows:
+        if not isinstance(row, (list, tuple)) or len(row) != 2:
+            return None
+        smiles, label = row
+        # Exact type checks keep bools, which str() formats differently, out
+        if type(smiles) is not str or type(label) not in (int, float):
+            return None
+        if not smiles or any(char in smiles for char in ',"\r\n'):
+            return None
+        lines.append(f"{smiles},{label}\r\n")
+    return "".join(lines).encode()
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False) as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(data_rows)
-        return f.name
 
+def _is_plain_csv(rows: list) -> bool:
+    """
+    Check whether rows can be written without csv quoting.
+
+    Args:
+        rows: Rows of cells to check
 
-def create_test_sdf_file(molecules: list, suffix: str = ".sdf") -> str:
+    Returns:
+        True if every cell is an int, a float or a non-empty string without
+        delimiters, quotes or line breaks
+    """
+    for row in rows:
+        for cell in row:
+            if isinstance(cell, str):
+                if not cell or any(char in cell for char in ',"\r\n'):
+                    return False
+            elif type(cell) not in (int, float):
+                return False
+    return True
+
+
+# Lines shared by every record of the simplified SDF files written below
+_SDF_PROGRAM_LINE = "  -OEChem-01010000002D\n"
+_SDF_RECORD_END = "M  END\n$$$$\n"
+
+
+def create_test_sdf_file(molecules: list,
+                         suffix: str = ".sdf",
+                         unique: bool = False,
+                         path: Optional[str] = None) -> str:
     """
     Create a temporary SDF file with test molecules.
 
+    Shares files between identical inputs like `create_test_csv_file`.
+
     Args:
         molecules: List of molecule data (simplified for testing)
         suffix: File suffix (default: .sdf)
+        unique: Return a path owned by the caller (default: False)
+        path: Caller-owned path to create the file at (default: a temporary file)
 
     Returns:
         Path to the created temporary file
     """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False) as f:
-        for i, mol in enumerate(molecules):
-            f.write(f"Molecule_{i}\n")
-            f.write("  -OEChem-01010000002D\n")
-            f.write(f"  {len(mol)} 0  0     0  0            999 V2000\n")
-            f.write(f"{mol}\n")
-            f.write("M  END\n")
-            f.write("$$$$\n")
 
-        return f.name
+    def write(file_path: str) -> None:
+        records = [
+            f"Molecule_{i}\n{_SDF_PROGRAM_LINE}  {len(mol)} 0  0     0  0            999 V2000\n{mol}\n{_SDF_RECORD_END}"
+            for i, mol in enumerate(molecules)
+        ]
+        # Encoded once and written in binary mode, bypassing the text layer
+        with open(file_path, "wb") as f:
+            f.write("".join(records).encode())
+
+    return _cached_file(molecules, suffix, write, unique, path)
 
 
 def cleanup_temp_file(file_path: str) -> None:
@@ -61,18 +278,19 @@ def cleanup_temp_file(file_path: str) -> None:
         file_path: Path to the file to remove
     """
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-    except Exception as e:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        return
+    except OSError as e:
         print(f"Error removing file {file_path}: {e}")
-        pass
 
 
 def create_test_settings_file(
     profile: Optional[str] = None,
     project: Optional[str] = None,
     base_url: Optional[str] = None,
-    **kwargs,
+    path: Optional[str] = None,
+    **kwargs: Any,
 ) -> str:
     """
     Create a temporary settings file for testing.
@@ -81,21 +299,136 @@ def create_test_settings_file(
         profile: Profile name
         project: Project name
         base_url: Base URL
+        path: Path to create the file at (default: a temporary file)
         **kwargs: Additional settings
 
     Returns:
         Path to the created settings file
     """
+    base_url = base_url or "http://localhost:8000"
+    additional_settings = tuple(kwargs.items())
+    try:
+        hash(additional_settings)
+    except TypeError:
+        # Unhashable additional settings cannot be memoized
+        payload = _encode_settings(profile, project, base_url, additional_settings)
+    else:
+        payload = _settings_payload(profile, project, base_url, additional_settings)
+
+    # Every call gets its own file, since tests modify and delete it
+    if path is not None:
+        with open(path, "wb") as f:
+            f.write(payload)
+        return path
+
+    temp_file, file_path = _fast_temp(".json", "wb")
+    with temp_file:
+        temp_file.write(payload)
+    return file_path
+
+
+def _encode_settings(profile: Optional[str], project: Optional[str], base_url: str,
+                     additional_settings: tuple) -> bytes:
+    """Serialize the contents of a test settings file, using orjson when available."""
     settings_data = {
         "profile": profile,
         "project": project,
-        "base_url": base_url or "http://localhost:8000",
-        "additional_settings": kwargs,
+        "base_url": base_url,
+        "additional_settings": dict(additional_settings),
     }
+    if ORJSON_AVAILABLE:
+        try:
+            # Like json, write non-string dict keys (e.g. ints) as strings
+            return orjson.dumps(settings_data,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(settings_data, indent=2, sort_keys=True).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def _settings_payload(profile: Optional[str], project: Optional[str], base_url: str,
+                      additional_settings: tuple) -> bytes:
+    """Memoized _encode_settings, for hashable additional settings."""
+    return _encode_settings(profile, project, base_url, additional_settings)
+
+
+def file_sha256(file_path: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def upload_cache_key(request: Any, **kwargs: Any) -> str:
+    """
+    Cache key for `requests_cache` that matches uploads by file content.
+
+    Multipart upload bodies are keyed on the method, URL, form fields and the
+    SHA-256 of the uploaded file, so re-uploading the same file hits the cache
+    without reading the streamed body. The per-run `filename` field is left
+    out of the key. Other requests use the default `requests_cache` key.
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(settings_data, f, indent=2)
-        return f.name
+    Args:
+        request: Prepared request to compute the key for
+        **kwargs: Keyword arguments forwarded to `requests_cache.create_key`
+
+    Returns:
+        Cache key for the request
+    """
+    from requests_cache import create_key
+
+    if not isinstance(request.body, MultipartEncoder):
+        return create_key(request, **kwargs)
+
+    digest = hashlib.sha256(f"{request.method} {request.url}".encode())
+    for name, value in sorted(request.body.fields.items()):
+        if name == "filename":
+            continue
+        if isinstance(value, tuple):
+            value = file_sha256(value[1].name)
+        digest.update(f"{name}={value}\n".encode())
+    return digest.hexdigest()
+
+
+def content_hash(*parts: Any) -> str:
+    """
+    Short, deterministic hash of the given values.
+
+    Args:
+        *parts: Values to hash (hashed through their repr)
+
+    Returns:
+        First 8 hex digits of the SHA-1 of the values
+    """
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:8]
+
+
+def bulk_upload(data_client: Any, items: List[Dict[str, Any]], max_workers: int = 8) -> List[Dict[str, Any]]:
+    """
+    Upload several files concurrently.
+
+    Args:
+        data_client: Data client to upload with
+        items: Keyword arguments for each `upload_data` call
+        max_workers: Maximum number of concurrent uploads
+
+    Returns:
+        Upload responses, in the same order as `items`
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda kwargs: data_client.upload_data(**kwargs), items))
 
 
 def mock_api_response(status_code: int = 200, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -115,7 +448,24 @@ def mock_api_response(status_code: int = 200, data: Optional[Dict[str, Any]] = N
     return {"status_code": status_code, "json": data}
 
 
-def generate_test_smiles(count: int = 10) -> list:
+_BASE_SMILES = (
+    "CCO",  # ethanol
+    "CCC",  # propane
+    "CCCO",  # propanol
+    "CCCC",  # butane
+    "CCCCO",  # butanol
+    "CC(C)O",  # isopropanol
+    "CC(C)C",  # isobutane
+    "C1CCCCC1",  # cyclohexane
+    "c1ccccc1",  # benzene
+    "CCN",  # ethylamine
+)
+# Linear alkanes with 1 to 10 carbons, used past the end of _BASE_SMILES
+_EXT_ALKANES = tuple("C" * (i + 1) for i in range(10))
+
+
+@functools.lru_cache(maxsize=None)
+def generate_test_smiles(count: int = 10) -> tuple:
     """
     Generate test SMILES strings.
 
@@ -123,34 +473,19 @@ def generate_test_smiles(count: int = 10) -> list:
         count: Number of SMILES to generate
 
     Returns:
-        List of test SMILES strings
-    """
-    base_smiles = [
-        "CCO",  # ethanol
-        "CCC",  # propane
-        "CCCO",  # propanol
-        "CCCC",  # butane
-        "CCCCO",  # butanol
-        "CC(C)O",  # isopropanol
-        "CC(C)C",  # isobutane
-        "C1CCCCC1",  # cyclohexane
-        "c1ccccc1",  # benzene
-        "CCN",  # ethylamine
-    ]
-
-    result = []
-    for i in range(count):
-        if i < len(base_smiles):
-            result.append(base_smiles[i])
-        else:
-            # Generate longer alkanes
-            chain_length = (i % 10) + 1
-            result.append("C" * chain_length)
+        Tuple of test SMILES strings
+    """
+    if count <= len(_BASE_SMILES):
+        return _BASE_SMILES[:count]
+    return _BASE_SMILES + tuple(_EXT_ALKANES[i % 10] for i in range(len(_BASE_SMILES), count))
+
 
-    return result
+# Label count above which generate_test_labels vectorizes with numpy
+_NUMPY_MIN_COUNT = 32
 
 
-def generate_test_labels(count: int = 10, label_type: str = "binary") -> list:
+@functools.lru_cache(maxsize=None)
+def generate_test_labels(count: int = 10, label_type: str = "binary") -> tuple:
     """
     Generate test labels.
 
@@ -159,14 +494,29 @@ def generate_test_labels(count: int = 10, label_type: str = "binary") -> list:
         label_type: Type of labels ("binary", "multiclass", "regression")
 
     Returns:
-        List of test labels
+        Tuple of test labels
     """
+    # numpy is optional and only used where it outweighs its import cost
+    if count > _NUMPY_MIN_COUNT:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            values = np.arange(count)
+            if label_type == "binary":
+                return tuple((values % 2).tolist())
+            elif label_type == "multiclass":
+                return tuple((values % 3).tolist())
+            elif label_type == "regression":
+                return tuple((values.astype(np.float64) / count).tolist())
+
     if label_type == "binary":
-        return [i % 2 for i in range(count)]
+        return tuple(i % 2 for i in range(count))
     elif label_type == "multiclass":
-        return [i % 3 for i in range(count)]
+        return tuple(i % 3 for i in range(count))
     elif label_type == "regression":
-        return [float(i) / count for i in range(count)]
+        return tuple(i / count for i in range(count))
     else:
         raise ValueError(f"Unknown label type: {label_type}")
 
@@ -187,17 +537,13 @@ def create_test_dataset_file(count: int = 20, label_type: str = "binary", file_f
     labels = generate_test_labels(count, label_type)
 
     if file_format == "csv":
-        data_rows = []
-        for i in range(count):
-            smile = smiles[i % len(smiles)]
-            label = labels[i % len(labels)]
-            data_rows.append([smile, label])
+        data_rows = list(zip(islice(cycle(smiles), count), islice(cycle(labels), count)))
 
         return create_test_csv_file(data_rows)
 
     elif file_format == "sdf":
         # For SDF, we'll create a simple format
-        molecules = smiles[:count]
+        molecules = list(smiles[:count])
         return create_test_sdf_file(molecules)
 
     else:
@@ -207,162 +553,230 @@ def create_test_dataset_file(count: int = 20, label_type: str = "binary", file_f
 class DataManager:
     """
     Manager for test data files and cleanup.
+
+    Files are created in a directory owned by the manager, which
+    `cleanup_all` removes as a whole. The directory is also removed when the
+    manager is garbage collected or the interpreter exits, so a manager that
+    is never cleaned up does not leak files.
+
+    Dataset files from `create_dataset_file` are shared between instances
+    like those of `create_test_csv_file`, and are removed when the
+    interpreter exits rather than by `cleanup_all`.
     """
 
-    def __init__(self):
-        self.temp_files = []
+    def __init__(self) -> None:
+        self.temp_files: List[str] = []
+        self._dir: Optional[str] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._counter = 0
+        self._make_dir()
+
+    def _make_dir(self) -> str:
+        """Create the manager's directory and register its removal."""
+        self._dir = tempfile.mkdtemp(prefix="pyds_dm_", dir=_TMPDIR)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self._dir, True)
+        return self._dir
+
+    def _new_path(self, suffix: str) -> str:
+        """Get a new path for a file in the manager's directory."""
+        directory = self._dir if self._dir is not None else self._make_dir()
+        self._counter += 1
+        return os.path.join(directory, f"f{self._counter}{suffix}")
 
     def create_csv_file(self, data_rows: list, headers: Optional[list] = None) -> str:
         """Create CSV file and track for cleanup."""
-        file_path = create_test_csv_file(data_rows, headers)
+        file_path = create_test_csv_file(data_rows, headers, path=self._new_path(".csv"))
         self.temp_files.append(file_path)
         return file_path
 
     def create_sdf_file(self, molecules: list) -> str:
         """Create SDF file and track for cleanup."""
-        file_path = create_test_sdf_file(molecules)
+        file_path = create_test_sdf_file(molecules, path=self._new_path(".sdf"))
         self.temp_files.append(file_path)
         return file_path
 
-    def create_dataset_file(self, count: int = 20, label_type: str = "binary", file_format: str = "csv") -> str:
-        """Create dataset file and track for cleanup."""
+    def create_dataset_file(self,
+                            count: int = 20,
+                            label_type: str = "binary",
+                            file_format: str = "csv",
+                            isolated: bool = False) -> str:
+        """
+        Get a dataset file, generating it only once per set of parameters.
+
+        The returned file is shared and must not be modified unless
+        `isolated` is set, in which case a tracked copy is returned instead.
+        """
         file_path = create_test_dataset_file(count, label_type, file_format)
-        self.temp_files.append(file_path)
-        return file_path
+        if not isolated:
+            return file_path
 
-    def create_settings_file(self, **kwargs) -> str:
+        copy_path = self._new_path(os.path.splitext(file_path)[1])
+        shutil.copyfile(file_path, copy_path)
+        self.temp_files.append(copy_path)
+        return copy_path
+
+    def create_settings_file(self, **kwargs: Any) -> str:
         """Create settings file and track for cleanup."""
-        file_path = create_test_settings_file(**kwargs)
+        file_path = create_test_settings_file(path=self._new_path(".json"), **kwargs)
         self.temp_files.append(file_path)
         return file_path
 
-    def cleanup_all(self):
+    def cleanup_all(self) -> None:
         """Clean up all tracked files."""
-        for file_path in self.temp_files:
-            cleanup_temp_file(file_path)
-        self.temp_files = []
-
-    def __enter__(self):
+        if self._finalizer is not None:
+            # Runs shutil.rmtree once and detaches the finalizer
+            self._finalizer()
+            self._finalizer = None
+            self._dir = None
+        self.temp_files.clear()
+
+    def __enter__(self) -> "DataManager":
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         self.cleanup_all()
 
 
 # Common Dataset Generators
-
-
-def get_small_classification_dataset():
+# Datasets are immutable module-level tuples shared between callers; convert
+# with list() where a mutable copy is needed.
+
+_SMALL_CLS: Tuple[Tuple[str, int], ...] = (
+    ("CCO", 1),
+    ("CCC", 0),
+    ("CCCO", 1),
+)
+
+_MINIMAL_CLS: Tuple[Tuple[str, int], ...] = (
+    ("CCO", 1),
+    ("CCC", 0),
+    ("CCCO", 1),
+    ("CCCC", 0),
+    ("CCCCO", 1),
+)
+
+_LARGE_CLS: Tuple[Tuple[str, int], ...] = (
+    ("CCO", 1),
+    ("CCC", 0),
+    ("CCCO", 1),
+    ("CCCC", 0),
+    ("CC(C)O", 1),
+    ("CC(C)C", 0),
+    ("CCCCO", 1),
+    ("CCCCC", 0),
+    ("CC(C)CO", 1),
+    ("CC(C)(C)C", 0),
+    ("CCCCCO", 1),
+    ("CCCCCC", 0),
+    ("C(C(C)O)O", 1),
+    ("CCCCCCC", 0),
+    ("CCCCCCCO", 1),
+)
+
+_SIMPLE_REG: Tuple[Tuple[str, float], ...] = (
+    ("C", 1.0),
+    ("CC", 2.0),
+    ("CCC", 3.0),
+    ("CCCC", 4.0),
+    ("CCCCC", 5.0),
+    ("CCCCCC", 6.0),
+    ("CO", 1.5),
+    ("CCO", 2.5),
+    ("CCCO", 3.5),
+)
+
+_COMPLEX_REG: Tuple[Tuple[str, float], ...] = (
+    ("C", 0.5),
+    ("CC", 1.0),
+    ("CCC", 1.5),
+    ("CCCC", 2.0),
+    ("CCCCC", 2.5),
+    ("CCO", 1.2),
+    ("CCCO", 1.7),
+    ("CCCCO", 2.2),
+    ("CC(C)C", 2.1),
+    ("CC(C)O", 1.6),
+    ("CCCCCC", 3.0),
+    ("CCCCCCC", 3.5),
+)
+
+
+def get_small_classification_dataset() -> Tuple[Tuple[str, int], ...]:
     """
     Get a small binary classification dataset (3 molecules).
     Suitable for basic functionality tests and quick validation.
 
     Returns:
-        list: [(smiles, label), ...] tuples
+        tuple: ((smiles, label), ...) pairs
     """
-    return [
-        ("CCO", 1),
-        ("CCC", 0),
-        ("CCCO", 1),
-    ]
+    return _SMALL_CLS
 
 
-def get_minimal_classification_dataset():
+def get_minimal_classification_dataset() -> Tuple[Tuple[str, int], ...]:
     """
     Get a minimal binary classification dataset (5 molecules).
     Good for tests that need slightly more data variety.
 
     Returns:
-        list: [(smiles, label), ...] tuples
+        tuple: ((smiles, label), ...) pairs
     """
-    return [
-        ("CCO", 1),
-        ("CCC", 0),
-        ("CCCO", 1),
-        ("CCCC", 0),
-        ("CCCCO", 1),
-    ]
+    return _MINIMAL_CLS
 
 
-def get_large_classification_dataset():
+def get_large_classification_dataset() -> Tuple[Tuple[str, int], ...]:
     """
     Get a diverse binary classification dataset (15 molecules).
     Provides good variety for robust model training tests.
 
     Returns:
-        list: [(smiles, label), ...] tuples
-    """
-    return [
-        ("CCO", 1),
-        ("CCC", 0),
-        ("CCCO", 1),
-        ("CCCC", 0),
-        ("CC(C)O", 1),
-        ("CC(C)C", 0),
-        ("CCCCO", 1),
-        ("CCCCC", 0),
-        ("CC(C)CO", 1),
-        ("CC(C)(C)C", 0),
-        ("CCCCCO", 1),
-        ("CCCCCC", 0),
-        ("C(C(C)O)O", 1),
-        ("CCCCCCC", 0),
-        ("CCCCCCCO", 1),
-    ]
-
-
-def get_simple_regression_dataset():
+        tuple: ((smiles, label), ...) pairs
+    """
+    return _LARGE_CLS
+
+
+def get_simple_regression_dataset() -> Tuple[Tuple[str, float], ...]:
     """
     Get a simple regression dataset with linear carbon count relationship.
     Good for linear regression tests.
 
     Returns:
-        list: [(smiles, value), ...] tuples
+        tuple: ((smiles, value), ...) pairs
     """
-    return [
-        ("C", 1.0),
-        ("CC", 2.0),
-        ("CCC", 3.0),
-        ("CCCC", 4.0),
-        ("CCCCC", 5.0),
-        ("CCCCCC", 6.0),
-        ("CO", 1.5),
-        ("CCO", 2.5),
-        ("CCCO", 3.5),
-    ]
+    return _SIMPLE_REG
 
 
-def get_complex_regression_dataset():
+def get_complex_regression_dataset() -> Tuple[Tuple[str, float], ...]:
     """
     Get a complex regression dataset with molecular weight proxy values.
     Good for more sophisticated regression tests.
 
     Returns:
-        list: [(smiles, value), ...] tuples
-    """
-    return [
-        ("C", 0.5),
-        ("CC", 1.0),
-        ("CCC", 1.5),
-        ("CCCC", 2.0),
-        ("CCCCC", 2.5),
-        ("CCO", 1.2),
-        ("CCCO", 1.7),
-        ("CCCCO", 2.2),
-        ("CC(C)C", 2.1),
-        ("CC(C)O", 1.6),
-        ("CCCCCC", 3.0),
-        ("CCCCCCC", 3.5),
-    ]
-
-
-def create_classification_csv(size: str = "small", headers: Optional[list] = None) -> str:
+        tuple: ((smiles, value), ...) pairs
+    """
+    return _COMPLEX_REG
+
+
+_CLASSIFICATION_DATASETS = {
+    "small": _SMALL_CLS,
+    "minimal": _MINIMAL_CLS,
+    "large": _LARGE_CLS,
+}
+_REGRESSION_DATASETS = {
+    "simple": _SIMPLE_REG,
+    "complex": _COMPLEX_REG,
+}
+
+
+def create_classification_csv(size: str = "small", headers: Optional[list] = None, unique: bool = False) -> str:
     """
     Create a CSV file with classification data.
 
+    See `create_test_csv_file` for the rules on shared and `unique` files.
+
     Args:
         size: "small" (3), "minimal" (5), or "large" (15) molecules
         headers: Custom headers (default: ["smiles", "label"])
+        unique: Return a path owned by the caller (default: False)
 
     Returns:
         str: Path to created CSV file
@@ -370,25 +784,22 @@ def create_classification_csv(size: str = "small", headers: Optional[list] = Non
     if headers is None:
         headers = ["smiles", "label"]
 
-    dataset_map = {
-        "small": get_small_classification_dataset(),
-        "minimal": get_minimal_classification_dataset(),
-        "large": get_large_classification_dataset(),
-    }
-
-    if size not in dataset_map:
-        raise ValueError(f"Size must be one of {list(dataset_map.keys())}")
+    if size not in _CLASSIFICATION_DATASETS:
+        raise ValueError(f"Size must be one of {list(_CLASSIFICATION_DATASETS.keys())}")
 
-    return create_test_csv_file(dataset_map[size], headers)
+    return create_test_csv_file(_CLASSIFICATION_DATASETS[size], headers, unique=unique)
 
 
-def create_regression_csv(complexity: str = "simple", headers: Optional[list] = None) -> str:
+def create_regression_csv(complexity: str = "simple", headers: Optional[list] = None, unique: bool = False) -> str:
     """
     Create a CSV file with regression data.
 
+    See `create_test_csv_file` for the rules on shared and `unique` files.
+
     Args:
         complexity: "simple" (linear) or "complex" (molecular weight proxy)
         headers: Custom headers (default: ["smiles", "target"])
+        unique: Return a path owned by the caller (default: False)
 
     Returns:
         str: Path to created CSV file
@@ -396,32 +807,59 @@ def create_regression_csv(complexity: str = "simple", headers: Optional[list] =
     if headers is None:
         headers = ["smiles", "target"]
 
-    dataset_map = {
-        "simple": get_simple_regression_dataset(),
-        "complex": get_complex_regression_dataset(),
-    }
+    if complexity not in _REGRESSION_DATASETS:
+        raise ValueError(f"Complexity must be one of {list(_REGRESSION_DATASETS.keys())}")
+
+    return create_test_csv_file(_REGRESSION_DATASETS[complexity], headers, unique=unique)
 
-    if complexity not in dataset_map:
-        raise ValueError(f"Complexity must be one of {list(dataset_map.keys())}")
 
-    return create_test_csv_file(dataset_map[complexity], headers)
+# Set once a decorated test fails to connect to the server, so the remaining
+# tests in the session skip without paying for another connection attempt
+_SERVER_STATE = {"unreachable": False}
+# Error messages that indicate the server could not be reached
+_NETERR_RE = re.compile(r"connection|refused|timeout|network|unavailable")
 
 
-def skip_if_server_unavailable(func):
+def _is_connection_failure(error: BaseException) -> bool:
     """
-    Decorator to skip tests if server is not available.
+    Check whether an error was caused by failing to reach the server.
+
+    Args:
+        error: Error raised by a test
+
+    Returns:
+        True if the error, or an error it was raised from or while handling,
+        is a requests ConnectionError or Timeout
     """
-    import functools
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, (requests.ConnectionError, requests.Timeout)):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
 
-    import pytest
+
+def skip_if_server_unavailable(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator to skip tests if server is not available.
+    """
 
     @functools.wraps(func)
-    def wrapper(*args, **kwargs):
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        import pytest
+
+        if _SERVER_STATE["unreachable"]:
+            pytest.skip("Server not available: previously unreachable in this session")
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            error_msg = str(e).lower()
-            if any(keyword in error_msg for keyword in ["connection", "refused", "timeout", "network", "unavailable"]):
+            if _NETERR_RE.search(str(e).lower()):
+                # Other errors mentioning e.g. "unavailable" (a 503) skip only
+                # this test, as the server may still answer later ones
+                if _is_connection_failure(e):
+                    _SERVER_STATE["unreachable"] = True
                 pytest.skip(f"Server not available: {e}")
             else:
                 raise
@@ -429,7 +867,63 @@ def skip_if_server_unavailable(func):
     return wrapper
 
 
-def assert_valid_address(address: str, expected_parts: Optional[list] = None):
+# Opt-in cache of live-server fixture values between pytest runs, for local
+# iteration on tests (e.g. DEBUG_CACHING=1 pytest tests/test_train.py)
+DEBUG_CACHING = os.environ.get("DEBUG_CACHING", "") not in ("", "0")
+# pytest's cache (config.cache), set by conftest; None if the cache plugin is disabled
+_DEBUG_CACHE_STATE: Dict[str, Any] = {"cache": None}
+
+
+def set_debug_cache(cache: Any) -> None:
+    """
+    Set the pytest cache that `debug_caching` stores fixture values in.
+
+    Args:
+        cache: pytest's config.cache, or None to disable debug caching
+    """
+    _DEBUG_CACHE_STATE["cache"] = cache
+
+
+def debug_caching(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorator caching a live-server fixture's value in the pytest cache across runs.
+
+    Only active when the DEBUG_CACHING environment variable is set and the
+    pytest cache is available. Values must be JSON serializable and are keyed
+    by the fixture name and the server URL of its client argument. The
+    server has no endpoint to look up a stored dataset, so a cached value is
+    only reused while the server answers its healthcheck; run with
+    --cache-clear after resetting the server's datastore.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _DEBUG_CACHE_STATE["cache"]
+        if not DEBUG_CACHING or cache is None:
+            return func(*args, **kwargs)
+
+        client = next((value for value in kwargs.values() if isinstance(value, BaseClient)), None)
+        key = f"pyds/debug/{func.__name__}/{content_hash(client.base_url if client is not None else '')}"
+
+        with FileLock(str(cache.mkdir("pyds") / "debug.lock")):
+            value = cache.get(key, None)
+            if value is not None:
+                try:
+                    if client is not None:
+                        client.healthcheck()
+                    return value
+                except Exception:
+                    pass
+
+            value = func(*args, **kwargs)
+            cache.set(key, value)
+
+        return value
+
+    return wrapper
+
+
+def assert_valid_address(address: str, expected_parts: Optional[list] = None) -> None:
     """
     Assert that an address has the expected format.
 
@@ -441,11 +935,11 @@ def assert_valid_address(address: str, expected_parts: Optional[list] = None):
     assert len(address) > 0
 
     if expected_parts:
-        for part in expected_parts:
-            assert part in address, f"Expected '{part}' in address '{address}'"
+        missing = [part for part in expected_parts if part not in address]
+        assert not missing, f"Expected {missing} in address '{address}'"
 
 
-def assert_api_response(response: Dict[str, Any], expected_keys: Optional[list] = None):
+def assert_api_response(response: Dict[str, Any], expected_keys: Optional[list] = None) -> None:
     """
     Assert that an API response has the expected structure.
 
@@ -456,5 +950,5 @@ def assert_api_response(response: Dict[str, Any], expected_keys: Optional[list]
     assert isinstance(response, dict)
 
     if expected_keys:
-        for key in expected_keys:
-            assert key in response, f"Expected key '{key}' in response"
+        missing = set(expected_keys) - response.keys()
+        assert not missing, f"Expected keys {sorted(missing)} in response"
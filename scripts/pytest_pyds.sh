@@ -28,6 +28,12 @@ if ! python -c "import pytest_cov" &> /dev/null; then
     exit 1
 fi
 
-# Run tests with coverage
+# Check if pytest-xdist is available
+if ! python -c "import xdist" &> /dev/null; then
+    echo "Error: pytest-xdist not found. Install with: pip install pytest-xdist"
+    exit 1
+fi
+
+# Run tests with coverage (parallelism is configured in pytest.ini)
 echo "Running pyds tests with coverage..."
 python -m pytest --cov --cov-config=.coveragerc --cov-report=term tests/